@@ -4,6 +4,7 @@ Manages application configuration from environment variables
 """
 
 import os
+import multiprocessing
 from datetime import timedelta
 from dotenv import load_dotenv
 
@@ -26,6 +27,15 @@ class Config:
     # Server Configuration
     HOST = os.getenv('HOST', '0.0.0.0')
     PORT = int(os.getenv('PORT', 5000))
+    # gunicorn worker class and process count (read by gunicorn_conf.py)
+    WEB_WORKER_CLASS = os.getenv('WEB_WORKER_CLASS', 'gevent')
+    WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 0)) or multiprocessing.cpu_count() * 2 + 1
+    
+    # mysql-connector's C extension blocks gevent's event loop on every
+    # query, so gevent workers need the pure-Python driver. It costs CPU:
+    # result rows are decoded in Python, noticeably slower than in C on
+    # large result sets. Set DB_USE_PURE=False for sync or thread workers.
+    DB_USE_PURE = os.getenv('DB_USE_PURE', str(WEB_WORKER_CLASS == 'gevent')).lower() == 'true'
     
     # Database Configuration
     DB_CONFIG = {
@@ -35,9 +45,25 @@ class Config:
         'user': os.getenv('DB_USER', 'root'),
         'password': os.getenv('DB_PASSWORD', ''),
         'charset': os.getenv('DB_CHARSET', 'utf8mb4'),
-        'autocommit': False,
-        'raise_on_warnings': True
+        'use_pure': DB_USE_PURE,
+        # Single statements commit themselves; get_db_cursor opens an
+        # explicit transaction for multi-statement work
+        'autocommit': True,
+        'raise_on_warnings': True,
+        # Seconds to wait for the MySQL server when opening a connection
+        'connection_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', 10))
     }
+    # Connections all worker processes may hold together; keep it below the
+    # MySQL server's max_connections (151 by default)
+    DB_MAX_CONNECTIONS = int(os.getenv('DB_MAX_CONNECTIONS', 100))
+    # Connections per process. Every worker opens a pool of its own, so unset
+    # or 0 splits DB_MAX_CONNECTIONS evenly across WEB_CONCURRENCY workers.
+    # Clamped to [1, 32], the largest pool mysql-connector accepts.
+    DB_POOL_SIZE = max(1, min(
+        int(os.getenv('DB_POOL_SIZE', 0)) or DB_MAX_CONNECTIONS // WEB_CONCURRENCY, 32
+    ))
+    # Seconds a request waits for a free pooled connection before failing
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
     
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', SECRET_KEY)
@@ -58,6 +84,9 @@ class Config:
     PASSWORD_REQUIRE_DIGITS = os.getenv('PASSWORD_REQUIRE_DIGITS', 'True').lower() == 'true'
     PASSWORD_REQUIRE_SPECIAL = os.getenv('PASSWORD_REQUIRE_SPECIAL', 'True').lower() == 'true'
     
+    # Email Validation - deliverability adds a DNS lookup per address
+    VALIDATE_EMAIL_DELIVERABILITY = os.getenv('VALIDATE_EMAIL_DELIVERABILITY', 'False').lower() == 'true'
+    
     # CORS Configuration
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(',')
     
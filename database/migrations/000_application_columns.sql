@@ -0,0 +1,39 @@
+-- ============================================================================
+-- Online Course Registration System (OCRS)
+-- Migration 000 - Columns the application reads and writes
+-- Language: MySQL 8.0+
+-- ============================================================================
+-- The application uses four columns the original schema never had:
+--   course.is_active            catalog listings and search, deactivation
+--   waitlist.status             active vs. enrolled/dropped waitlist entries
+--   waitlist.added_date         waitlist listings
+--   enrollment.enrollment_date  enrollment listings and payloads
+--
+-- They are added here, not in schema.sql, so that databases created from the
+-- original schema can be upgraded by running this migration. Fresh installs
+-- pick them up through init_database, which runs schema.sql and then every
+-- migration in filename order. MySQL 8.0 has no ADD COLUMN IF NOT EXISTS;
+-- run this once per database.
+--
+-- Backfills for existing rows:
+--   course.is_active mirrors is_retired.
+--   waitlist.added_date copies created_at. The waitlist update trigger only
+--   acts on status changes, so section counters are untouched.
+--   enrollment.enrollment_date is not backfilled. Every enrollment UPDATE
+--   writes an audit_log row (after_enrollment_update), so existing rows
+--   keep the migration time; enrolled_at still holds the original time.
+-- ============================================================================
+
+ALTER TABLE course
+    ADD COLUMN is_active TINYINT(1) DEFAULT 1 AFTER is_retired;
+
+UPDATE course SET is_active = 0 WHERE is_retired = 1;
+
+ALTER TABLE waitlist
+    ADD COLUMN status VARCHAR(20) NOT NULL DEFAULT 'Active' AFTER position,
+    ADD COLUMN added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP AFTER status;
+
+UPDATE waitlist SET added_date = created_at;
+
+ALTER TABLE enrollment
+    ADD COLUMN enrollment_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP AFTER grade;
@@ -0,0 +1,40 @@
+-- ============================================================================
+-- Online Course Registration System (OCRS)
+-- Migration 001 - Course catalog query indexes
+-- Language: MySQL 8.0+
+-- ============================================================================
+-- Supports the queries in src/courses/models.py:
+--   get_all_courses            WHERE is_active = 1 [AND dept_id / credits / course_number]
+--                              ORDER BY d.code, c.course_number
+--   iter_courses_by_department JOIN on dept_id, WHERE is_active = 1
+--                              ORDER BY c.course_number
+--   get_total_courses          COUNT(*) WHERE is_active = 1 [AND dept_id]
+--
+-- The department listing selects title, description and the department
+-- columns, so the index is not covering for it: it serves the
+-- (dept_id, is_active) lookup and the course_number order without a
+-- filesort, and each matching row is then read from the table. credits is
+-- appended to the key so credit filters on a department's courses are
+-- checked in the index before those row reads.
+--
+-- Already covered by the base schema, so not recreated here:
+--   course_prerequisite PRIMARY KEY (course_id, prereq_course_id)
+--   department          UNIQUE (code) / idx_dept_code
+--
+-- Verify after applying:
+--   EXPLAIN SELECT COUNT(*) FROM course WHERE is_active = 1 AND dept_id = 1;
+--     expect key idx_course_dept_active_num and "Using index" in Extra
+--   EXPLAIN SELECT c.course_id, c.title, c.description, c.credits
+--     FROM course c WHERE c.dept_id = 1 AND c.is_active = 1
+--     ORDER BY c.course_number;
+--     expect key idx_course_dept_active_num and no "Using filesort"
+-- ============================================================================
+
+-- Department listing: equality on (dept_id, is_active), ordered by
+-- course_number; rows are still read from the table for the other columns
+CREATE INDEX idx_course_dept_active_num
+    ON course (dept_id, is_active, course_number, credits);
+
+-- Credit range filters on the catalog listing
+CREATE INDEX idx_course_active_credits
+    ON course (is_active, credits);
@@ -0,0 +1,95 @@
+-- ============================================================================
+-- Online Course Registration System (OCRS)
+-- Migration 002 - Precomputed section schedule conflicts
+-- Language: MySQL 8.0+
+-- ============================================================================
+-- section_conflict holds every ordered pair of sections in the same term
+-- with at least one overlapping meeting, in both directions. It turns the
+-- schedule conflict check in src/enrollments/models.py into an indexed
+-- lookup against the student's enrolled sections:
+--   validate_enrollment_bulk   JOIN section_conflict ON (section_a, section_b)
+--                              as a scalar subquery
+--
+-- Pairs are kept current by triggers on section_schedule, which rebuild
+-- the pairs of the affected section. Moving a section to another term is
+-- not tracked; run CALL refresh_section_conflicts(<section_id>) after one.
+-- ============================================================================
+
+CREATE TABLE section_conflict (
+    section_a INT NOT NULL,
+    section_b INT NOT NULL,
+    PRIMARY KEY (section_a, section_b),
+    FOREIGN KEY (section_a) REFERENCES section(section_id) ON DELETE CASCADE,
+    FOREIGN KEY (section_b) REFERENCES section(section_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Procedure: Rebuild the conflict pairs of one section
+DELIMITER //
+CREATE PROCEDURE refresh_section_conflicts(IN p_section_id INT)
+BEGIN
+    DELETE FROM section_conflict
+    WHERE section_a = p_section_id OR section_b = p_section_id;
+
+    INSERT IGNORE INTO section_conflict (section_a, section_b)
+    SELECT DISTINCT ss1.section_id, ss2.section_id
+    FROM section_schedule ss1
+    JOIN section s1 ON ss1.section_id = s1.section_id
+    JOIN section_schedule ss2 ON ss2.day_of_week = ss1.day_of_week
+        AND ss2.start_time < ss1.end_time
+        AND ss2.end_time > ss1.start_time
+        AND ss2.section_id <> ss1.section_id
+    JOIN section s2 ON ss2.section_id = s2.section_id
+        AND s2.term_id = s1.term_id
+    WHERE ss1.section_id = p_section_id;
+
+    INSERT IGNORE INTO section_conflict (section_a, section_b)
+    SELECT section_b, section_a
+    FROM section_conflict
+    WHERE section_a = p_section_id;
+END//
+DELIMITER ;
+
+-- Trigger: Add conflicts for a new meeting
+DELIMITER //
+CREATE TRIGGER after_section_schedule_insert
+AFTER INSERT ON section_schedule
+FOR EACH ROW
+BEGIN
+    CALL refresh_section_conflicts(NEW.section_id);
+END//
+DELIMITER ;
+
+-- Trigger: Rebuild conflicts for a changed meeting
+DELIMITER //
+CREATE TRIGGER after_section_schedule_update
+AFTER UPDATE ON section_schedule
+FOR EACH ROW
+BEGIN
+    CALL refresh_section_conflicts(NEW.section_id);
+    IF OLD.section_id <> NEW.section_id THEN
+        CALL refresh_section_conflicts(OLD.section_id);
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Rebuild conflicts for a removed meeting
+DELIMITER //
+CREATE TRIGGER after_section_schedule_delete
+AFTER DELETE ON section_schedule
+FOR EACH ROW
+BEGIN
+    CALL refresh_section_conflicts(OLD.section_id);
+END//
+DELIMITER ;
+
+-- Backfill from existing schedules
+INSERT IGNORE INTO section_conflict (section_a, section_b)
+SELECT DISTINCT ss1.section_id, ss2.section_id
+FROM section_schedule ss1
+JOIN section s1 ON ss1.section_id = s1.section_id
+JOIN section_schedule ss2 ON ss2.day_of_week = ss1.day_of_week
+    AND ss2.start_time < ss1.end_time
+    AND ss2.end_time > ss1.start_time
+    AND ss2.section_id <> ss1.section_id
+JOIN section s2 ON ss2.section_id = s2.section_id
+    AND s2.term_id = s1.term_id;
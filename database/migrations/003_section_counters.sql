@@ -0,0 +1,148 @@
+-- ============================================================================
+-- Online Course Registration System (OCRS)
+-- Migration 003 - Section enrollment and waitlist counter caches
+-- Language: MySQL 8.0+
+-- ============================================================================
+-- section.enrolled_count  number of enrollment rows with status 'Enrolled'
+-- section.waitlist_count  number of waitlist rows with status 'Active'
+--
+-- Maintained by the triggers below, so reads are a column fetch instead of
+-- a filtered COUNT(*) over enrollment / waitlist:
+--   src/enrollments/models.py  enroll_student
+--   src/faculty/models.py      get_faculty_sections, get_section_statistics
+--   src/courses/models.py      get_course_full, get_course_with_sections
+--
+-- Grade-only enrollment updates do not touch the section row.
+--
+-- Because these triggers UPDATE section, a statement that writes enrollment
+-- or waitlist must not read section itself (no INSERT ... SELECT FROM
+-- section, no UPDATE ... JOIN section): MySQL rejects the trigger's update
+-- with error 1442. Check capacity first under SELECT ... FOR UPDATE on the
+-- section row, then write with a plain statement, as enroll_student does.
+-- ============================================================================
+
+ALTER TABLE section
+    ADD COLUMN enrolled_count SMALLINT NOT NULL DEFAULT 0,
+    ADD COLUMN waitlist_count SMALLINT NOT NULL DEFAULT 0;
+
+-- Trigger: Count new enrollments
+DELIMITER //
+CREATE TRIGGER after_enrollment_insert_count
+AFTER INSERT ON enrollment
+FOR EACH ROW
+BEGIN
+    IF NEW.enrollment_status = 'Enrolled' THEN
+        UPDATE section SET enrolled_count = enrolled_count + 1
+        WHERE section_id = NEW.section_id;
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Move counts on enrollment status or section changes
+DELIMITER //
+CREATE TRIGGER after_enrollment_update_count
+AFTER UPDATE ON enrollment
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.enrollment_status <=> NEW.enrollment_status)
+       OR OLD.section_id <> NEW.section_id THEN
+        IF OLD.enrollment_status = 'Enrolled' THEN
+            UPDATE section SET enrolled_count = enrolled_count - 1
+            WHERE section_id = OLD.section_id;
+        END IF;
+        IF NEW.enrollment_status = 'Enrolled' THEN
+            UPDATE section SET enrolled_count = enrolled_count + 1
+            WHERE section_id = NEW.section_id;
+        END IF;
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Uncount deleted enrollments
+DELIMITER //
+CREATE TRIGGER after_enrollment_delete_count
+AFTER DELETE ON enrollment
+FOR EACH ROW
+BEGIN
+    IF OLD.enrollment_status = 'Enrolled' THEN
+        UPDATE section SET enrolled_count = enrolled_count - 1
+        WHERE section_id = OLD.section_id;
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Count new waitlist entries
+DELIMITER //
+CREATE TRIGGER after_waitlist_insert_count
+AFTER INSERT ON waitlist
+FOR EACH ROW
+BEGIN
+    IF NEW.status = 'Active' THEN
+        UPDATE section SET waitlist_count = waitlist_count + 1
+        WHERE section_id = NEW.section_id;
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Move counts on waitlist status or section changes
+DELIMITER //
+CREATE TRIGGER after_waitlist_update_count
+AFTER UPDATE ON waitlist
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.status <=> NEW.status) OR OLD.section_id <> NEW.section_id THEN
+        IF OLD.status = 'Active' THEN
+            UPDATE section SET waitlist_count = waitlist_count - 1
+            WHERE section_id = OLD.section_id;
+        END IF;
+        IF NEW.status = 'Active' THEN
+            UPDATE section SET waitlist_count = waitlist_count + 1
+            WHERE section_id = NEW.section_id;
+        END IF;
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Uncount deleted waitlist entries
+DELIMITER //
+CREATE TRIGGER after_waitlist_delete_count
+AFTER DELETE ON waitlist
+FOR EACH ROW
+BEGIN
+    IF OLD.status = 'Active' THEN
+        UPDATE section SET waitlist_count = waitlist_count - 1
+        WHERE section_id = OLD.section_id;
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Prevent enrollment over capacity, now from the counter
+DROP TRIGGER IF EXISTS before_enrollment_insert;
+DELIMITER //
+CREATE TRIGGER before_enrollment_insert
+BEFORE INSERT ON enrollment
+FOR EACH ROW
+BEGIN
+    IF NEW.enrollment_status = 'Enrolled' AND EXISTS (
+        SELECT 1 FROM section
+        WHERE section_id = NEW.section_id
+        AND enrolled_count >= capacity
+    ) THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Section is at full capacity';
+    END IF;
+END//
+DELIMITER ;
+
+-- Backfill from existing rows
+UPDATE section s
+SET s.enrolled_count = (
+        SELECT COUNT(*) FROM enrollment e
+        WHERE e.section_id = s.section_id
+        AND e.enrollment_status = 'Enrolled'
+    ),
+    s.waitlist_count = (
+        SELECT COUNT(*) FROM waitlist w
+        WHERE w.section_id = s.section_id
+        AND w.status = 'Active'
+    );
@@ -0,0 +1,23 @@
+-- ============================================================================
+-- Online Course Registration System (OCRS)
+-- Migration 004 - Unique waitlist positions per section
+-- Language: MySQL 8.0+
+-- ============================================================================
+-- WaitlistModel.add_to_waitlist and the before_waitlist_insert trigger both
+-- assign MAX(position) + 1 over all of a section's waitlist rows, so a
+-- position is never reused within a section. add_to_waitlist serializes on
+-- the section row; making (section_id, position) unique turns any remaining
+-- race into a failed insert, which add_to_waitlist retries once, instead of
+-- two students sharing a place in the queue.
+--
+-- MySQL has no partial indexes, so the key covers inactive rows too; that
+-- holds because positions are not reused.
+--
+-- Check for duplicates before applying (expect an empty result):
+--   SELECT section_id, position, COUNT(*) FROM waitlist
+--   GROUP BY section_id, position HAVING COUNT(*) > 1;
+-- ============================================================================
+
+ALTER TABLE waitlist
+    DROP INDEX idx_section_position,
+    ADD UNIQUE KEY unique_section_position (section_id, position);
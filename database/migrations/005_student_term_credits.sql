@@ -0,0 +1,91 @@
+-- ============================================================================
+-- Online Course Registration System (OCRS)
+-- Migration 005 - Maintained per-term credit totals
+-- Language: MySQL 8.0+
+-- ============================================================================
+-- student_term_credits holds each student's enrolled credits per term, so
+-- the credit limit check in src/enrollments/models.py is a primary key
+-- lookup instead of a SUM over enrollment JOIN section JOIN course:
+--   validate_enrollment_bulk   SELECT total_credits as a scalar subquery
+--
+-- Totals follow enrollment rows with status 'Enrolled' through the triggers
+-- below. Changing a course's credits is not tracked; rerun the backfill at
+-- the end of this file after one.
+-- ============================================================================
+
+CREATE TABLE student_term_credits (
+    student_id INT NOT NULL,
+    term_id INT NOT NULL,
+    total_credits DECIMAL(5,1) NOT NULL DEFAULT 0,
+    PRIMARY KEY (student_id, term_id),
+    FOREIGN KEY (student_id) REFERENCES student_profile(student_id) ON DELETE CASCADE,
+    FOREIGN KEY (term_id) REFERENCES term(term_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Procedure: Add (p_sign = 1) or remove (p_sign = -1) a section's credits
+DELIMITER //
+CREATE PROCEDURE adjust_student_term_credits(
+    IN p_student_id INT, IN p_section_id INT, IN p_sign INT
+)
+BEGIN
+    INSERT INTO student_term_credits (student_id, term_id, total_credits)
+    SELECT p_student_id, s.term_id, GREATEST(p_sign * c.credits, 0)
+    FROM section s
+    JOIN course c ON s.course_id = c.course_id
+    WHERE s.section_id = p_section_id
+    ON DUPLICATE KEY UPDATE
+        total_credits = GREATEST(total_credits + p_sign * c.credits, 0);
+END//
+DELIMITER ;
+
+-- Trigger: Add credits for new enrollments
+DELIMITER //
+CREATE TRIGGER after_enrollment_insert_credits
+AFTER INSERT ON enrollment
+FOR EACH ROW
+BEGIN
+    IF NEW.enrollment_status = 'Enrolled' THEN
+        CALL adjust_student_term_credits(NEW.student_id, NEW.section_id, 1);
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Move credits on enrollment status or section changes
+DELIMITER //
+CREATE TRIGGER after_enrollment_update_credits
+AFTER UPDATE ON enrollment
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.enrollment_status <=> NEW.enrollment_status)
+       OR OLD.section_id <> NEW.section_id
+       OR OLD.student_id <> NEW.student_id THEN
+        IF OLD.enrollment_status = 'Enrolled' THEN
+            CALL adjust_student_term_credits(OLD.student_id, OLD.section_id, -1);
+        END IF;
+        IF NEW.enrollment_status = 'Enrolled' THEN
+            CALL adjust_student_term_credits(NEW.student_id, NEW.section_id, 1);
+        END IF;
+    END IF;
+END//
+DELIMITER ;
+
+-- Trigger: Remove credits for deleted enrollments
+DELIMITER //
+CREATE TRIGGER after_enrollment_delete_credits
+AFTER DELETE ON enrollment
+FOR EACH ROW
+BEGIN
+    IF OLD.enrollment_status = 'Enrolled' THEN
+        CALL adjust_student_term_credits(OLD.student_id, OLD.section_id, -1);
+    END IF;
+END//
+DELIMITER ;
+
+-- Backfill from existing enrollments
+REPLACE INTO student_term_credits (student_id, term_id, total_credits)
+SELECT e.student_id, s.term_id, SUM(c.credits)
+FROM enrollment e
+JOIN section s ON e.section_id = s.section_id
+JOIN course c ON s.course_id = c.course_id
+WHERE e.enrollment_status = 'Enrolled'
+GROUP BY e.student_id, s.term_id;
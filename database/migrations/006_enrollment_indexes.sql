@@ -0,0 +1,36 @@
+-- ============================================================================
+-- Online Course Registration System (OCRS)
+-- Migration 006 - Enrollment hot-path covering indexes
+-- Language: MySQL 8.0+
+-- ============================================================================
+-- Supports the queries in src/enrollments/models.py and src/faculty/models.py:
+--   validate_enrollment_bulk    WHERE student_id = ? AND enrollment_status = 'Enrolled'
+--                               for the conflict probe, and the prerequisite
+--                               NOT EXISTS probe on
+--                               (student_id, enrollment_status) -> section_id, grade
+--   get_student_enrollment_payloads
+--                               WHERE student_id = ?
+--   get_section_roster          WHERE section_id = ? AND enrollment_status IN (...)
+--   get_section_statistics      WHERE section_id = ?, grouped by status and grade
+--
+-- MySQL has no INCLUDE clause, so covered columns are appended to the key.
+-- The new indexes start with the old single-column keys, which are dropped
+-- in the same statement so the foreign keys always have an index.
+--
+-- Not added: a (section_id, status) waitlist index. Waitlist lengths come
+-- from section.waitlist_count (migration 003) and positions from
+-- unique_section_position (migration 004).
+--
+-- Verify after applying (expect "Using index" in Extra for the enrollment
+-- table):
+--   EXPLAIN SELECT 1 FROM enrollment e
+--     WHERE e.student_id = 1 AND e.enrollment_status = 'Enrolled';
+--   EXPLAIN SELECT enrollment_status, grade FROM enrollment
+--     WHERE section_id = 1;
+-- ============================================================================
+
+ALTER TABLE enrollment
+    ADD INDEX idx_enrollment_student_status (student_id, enrollment_status, section_id, grade),
+    ADD INDEX idx_enrollment_section_status (section_id, enrollment_status, grade),
+    DROP INDEX idx_student,
+    DROP INDEX idx_section;
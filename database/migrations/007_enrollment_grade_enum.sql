@@ -0,0 +1,22 @@
+-- ============================================================================
+-- Online Course Registration System (OCRS)
+-- Migration 007 - Store enrollment grades as an ENUM
+-- Language: MySQL 8.0+
+-- ============================================================================
+-- enrollment.grade was VARCHAR(10). As an ENUM it is stored in one byte
+-- and compares as an integer, which shrinks the covering indexes from
+-- migration 006 that end in grade. Values match VALID_GRADES in
+-- src/faculty/models.py. Queries keep their string literals; MySQL maps
+-- them to the ENUM index.
+--
+-- The other status columns are already ENUMs in the base schema:
+-- enrollment.enrollment_status, section.status.
+--
+-- Check for grades outside the list before applying (expect an empty
+-- result):
+--   SELECT DISTINCT grade FROM enrollment
+--   WHERE grade NOT IN ('A', 'B', 'C', 'D', 'F', 'P', 'NP', 'W', 'I');
+-- ============================================================================
+
+ALTER TABLE enrollment
+    MODIFY grade ENUM('A', 'B', 'C', 'D', 'F', 'P', 'NP', 'W', 'I') NULL;
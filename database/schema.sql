@@ -10,6 +10,10 @@
 DROP TABLE IF EXISTS audit_log;
 DROP TABLE IF EXISTS waitlist;
 DROP TABLE IF EXISTS enrollment;
+DROP TABLE IF EXISTS section_conflict;
+DROP PROCEDURE IF EXISTS refresh_section_conflicts;
+DROP TABLE IF EXISTS student_term_credits;
+DROP PROCEDURE IF EXISTS adjust_student_term_credits;
 DROP TABLE IF EXISTS section_schedule;
 DROP TABLE IF EXISTS section;
 DROP TABLE IF EXISTS course_prerequisite;
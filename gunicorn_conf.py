@@ -0,0 +1,37 @@
+"""
+OCRS Backend - Gunicorn Configuration
+Production WSGI server settings
+
+Handlers spend most of their time waiting on MySQL, so each worker runs
+gevent greenlets to keep several queries in flight at once. Worker class,
+worker count, database pool size and driver choice all come from Config
+(config/config.py), which the workers read the same way.
+
+Requests beyond the pool size would only wait up to DB_POOL_TIMEOUT seconds
+for a connection, so greenlets and threads per worker are capped at the
+pool size.
+"""
+
+import os
+
+# Only the config module: src.utils.database must not be imported before
+# the gevent worker has monkey-patched the standard library
+from config.config import get_config
+
+app_config = get_config()
+
+bind = f"{app_config.HOST}:{app_config.PORT}"
+
+worker_class = app_config.WEB_WORKER_CLASS
+workers = app_config.WEB_CONCURRENCY
+
+db_pool_size = app_config.DB_POOL_SIZE
+worker_connections = min(int(os.getenv('WEB_WORKER_CONNECTIONS', db_pool_size)), db_pool_size)
+threads = min(int(os.getenv('WEB_THREADS', 8)), db_pool_size)
+
+timeout = int(os.getenv('WEB_TIMEOUT', 30))
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'INFO').lower()
@@ -14,6 +14,7 @@ from getpass import getpass
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from config.config import get_config
+from src.utils.database import execute_script, read_sql_script, schema_scripts
 
 config = get_config()
 
@@ -75,16 +76,9 @@ def run_sql_file(filename, description):
     try:
         cursor = conn.cursor()
         
-        # Read SQL file
-        with open(filename, 'r') as f:
-            sql_content = f.read()
-        
-        # Split and execute statements
-        statements = sql_content.split(';')
-        for statement in statements:
-            statement = statement.strip()
-            if statement and not statement.startswith('--'):
-                cursor.execute(statement)
+        # Read SQL file; DELIMITER blocks (triggers, procedures) are
+        # handled by read_sql_script, which a split on ';' would break
+        execute_script(cursor, read_sql_script(filename))
         
         conn.commit()
         print(f"✅ {description} completed successfully")
@@ -138,7 +132,7 @@ def main():
     
     print("\nThis script will:")
     print("1. Create the OCRS database")
-    print("2. Initialize the database schema")
+    print("2. Initialize the database schema and apply migrations")
     print("3. (Optional) Load seed data")
     
     # Ask for confirmation
@@ -158,11 +152,11 @@ def main():
         print("\n❌ Setup failed: Cannot create database")
         return
     
-    # Step 3: Initialize schema
-    schema_file = os.path.join(os.path.dirname(__file__), '..', 'database', 'schema.sql')
-    if not run_sql_file(schema_file, "Initializing database schema"):
-        print("\n❌ Setup failed: Cannot initialize schema")
-        return
+    # Step 3: Initialize schema, then apply migrations in order
+    for sql_file in schema_scripts():
+        if not run_sql_file(sql_file, f"Applying {os.path.basename(sql_file)}"):
+            print("\n❌ Setup failed: Cannot initialize schema")
+            return
     
     # Step 4: Ask about seed data
     seed = input("\n📊 Do you want to load sample data? (yes/no): ")
@@ -5,6 +5,7 @@ Database operations for admin functions
 
 from src.utils.database import execute_query, execute_update, get_db_cursor
 from src.utils.logger import setup_logger
+from src.courses.utils import invalidate_course_caches
 
 logger = setup_logger('ocrs.admin.models')
 
@@ -131,8 +132,10 @@ class AdminCourseModel:
                 """, (dept_id, course_number, title, description, credits))
                 
                 course_id = cursor.lastrowid
-                logger.info(f"Course created: {course_id}")
-                return course_id
+            
+            invalidate_course_caches()
+            logger.info(f"Course created: {course_id}")
+            return course_id
                 
         except Exception as e:
             logger.error(f"Error creating course: {e}")
@@ -158,6 +161,7 @@ class AdminCourseModel:
             query = f"UPDATE course SET {', '.join(updates)} WHERE course_id = %s"
             
             execute_update(query, tuple(params))
+            invalidate_course_caches()
             logger.info(f"Course updated: {course_id}")
             return True
             
@@ -170,6 +174,7 @@ class AdminCourseModel:
         """Deactivate a course"""
         try:
             execute_update("UPDATE course SET is_active = 0 WHERE course_id = %s", (course_id,))
+            invalidate_course_caches()
             logger.info(f"Course deactivated: {course_id}")
             return True
         except Exception as e:
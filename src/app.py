@@ -5,14 +5,14 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from flask import Flask, jsonify
+from flask import Flask
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from flasgger import Swagger
 
 from config.config import get_config
 from src.utils.logger import setup_logger
-from src.utils.responses import error_response
+from src.utils.responses import error_response, json_response
 from src.chatbot.routes import chatbot_bp
 
 logger = setup_logger("ocrs.app")
@@ -72,7 +72,11 @@ def init_extensions(app):
         "swagger": "2.0",
         "info": {
             "title": "OCRS API",
-            "description": "Online Course Registration System API Documentation",
+            "description": (
+                "Online Course Registration System API Documentation. "
+                "Response timestamps are UTC in ISO 8601 with whole seconds "
+                "and no offset, e.g. 2025-11-01T12:00:00."
+            ),
             "version": "1.0.0",
             "contact": {
                 "name": "OCRS Team",
@@ -156,7 +160,7 @@ def register_error_handlers(app):
 def register_health_check(app):
     @app.route("/health", methods=["GET"])
     def health_root():
-        return jsonify(
+        return json_response(
             {
                 "status": "healthy",
                 "service": "OCRS Backend",
@@ -166,7 +170,7 @@ def register_health_check(app):
 
     @app.route("/api/health", methods=["GET"])
     def api_health():
-        return jsonify(
+        return json_response(
             {
                 "status": "healthy",
                 "service": "OCRS Backend API",
@@ -177,7 +181,7 @@ def register_health_check(app):
 
     @app.route("/api/health/app", methods=["GET"])
     def api_health_app():
-        return jsonify(
+        return json_response(
             {
                 "status": "healthy",
                 "service": "OCRS Backend",
@@ -188,7 +192,7 @@ def register_health_check(app):
 
     @app.route("/", methods=["GET"])
     def index():
-        return jsonify(
+        return json_response(
             {
                 "message": "Welcome to OCRS API",
                 "version": app.config.get("APP_VERSION", "1.0.0"),
@@ -4,7 +4,6 @@ Decorators for protecting routes and checking permissions
 """
 
 from functools import wraps
-from flask import jsonify
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
 from src.utils.responses import error_response, forbidden_response
 from src.utils.logger import setup_logger
@@ -1,7 +1,7 @@
-from datetime import datetime
-from flask import request, jsonify
+from flask import request
 from src.chatbot import chatbot_bp
 from src.utils.logger import setup_logger
+from src.utils.responses import success_response
 
 logger = setup_logger("ocrs.chatbot")
 
@@ -113,17 +113,10 @@ def chatbot_message():
 
   reply = _generate_reply(message, current_user)
 
-  return (
-      jsonify(
-          {
-              "success": True,
-              "data": {
-                  "request": message,
-                  "reply": reply,
-                  "user": current_user,
-              },
-              "timestamp": datetime.utcnow().isoformat(),
-          }
-      ),
-      200,
+  return success_response(
+      data={
+          "request": message,
+          "reply": reply,
+          "user": current_user,
+      }
   )
@@ -3,11 +3,57 @@ OCRS Backend - Course Models
 Database operations for course management
 """
 
-from src.utils.database import execute_query, get_db_cursor
+import orjson
+
+from src.utils.database import execute_query, stream_query
 from src.utils.logger import setup_logger
 
 logger = setup_logger('ocrs.courses.models')
 
+_DEPARTMENT_COURSES_QUERY = """
+    SELECT 
+        c.course_id,
+        c.course_number,
+        c.title,
+        c.description,
+        c.credits,
+        c.is_active,
+        d.dept_id,
+        d.code as dept_code,
+        d.name as dept_name
+    FROM course c
+    JOIN department d ON c.dept_id = d.dept_id
+    WHERE d.code = %s AND c.is_active = 1
+    ORDER BY c.course_number
+"""
+
+# One statement text for every search, with or without a department filter,
+# so the server parses a single query shape
+_SEARCH_COURSES_QUERY = """
+    SELECT 
+        c.course_id,
+        c.course_number,
+        c.title,
+        c.description,
+        c.credits,
+        c.is_active,
+        d.dept_id,
+        d.code as dept_code,
+        d.name as dept_name
+    FROM course c
+    JOIN department d ON c.dept_id = d.dept_id
+    WHERE c.is_active = 1
+    AND (
+        c.title LIKE %s
+        OR c.course_number LIKE %s
+        OR c.description LIKE %s
+        OR d.code LIKE %s
+    )
+    AND (%s IS NULL OR c.dept_id = %s)
+    ORDER BY d.code, c.course_number
+    LIMIT %s
+"""
+
 
 class CourseModel:
     """Course database operations"""
@@ -23,7 +69,7 @@ class CourseModel:
             min_credits (float): Minimum credits
             max_credits (float): Maximum credits
             level (str): Course level (100, 200, 300, 400)
-            limit (int): Number of results
+            limit (int): Number of results (None for all)
             offset (int): Pagination offset
             
         Returns:
@@ -68,28 +114,60 @@ class CourseModel:
                 params.append(f"{level}%")
             
             query += " ORDER BY d.code, c.course_number"
-            query += " LIMIT %s OFFSET %s"
-            params.extend([limit, offset])
+            
+            if limit is not None:
+                query += " LIMIT %s OFFSET %s"
+                params.extend([limit, offset])
             
             return execute_query(query, tuple(params))
             
         except Exception as e:
-            logger.error(f"Error fetching courses: {e}")
+            logger.error("Error fetching courses: %s", e)
             return []
     
     @staticmethod
-    def get_course_by_id(course_id):
+    def get_course_full(course_id, include_sections=False):
         """
-        Get course by ID with full details
+        Get course by ID with prerequisites and, optionally, current-term
+        sections in a single query
+        
+        Prerequisites and sections are aggregated server-side into JSON
+        arrays by scalar subqueries, so the course row is not multiplied by
+        a join fan-out.
         
         Args:
             course_id (int): Course ID
+            include_sections (bool): Also aggregate current-term sections
             
         Returns:
-            dict: Course details or None
+            dict: Course details with 'prerequisites' and 'sections' lists
+                ('sections' is None when not requested), or None
         """
         try:
-            query = """
+            sections_column = """
+                    (
+                        SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                            'section_id', s.section_id,
+                            'section_number', s.section_number,
+                            'capacity', s.capacity,
+                            'location', s.location,
+                            'status', s.status,
+                            'enrolled_count', s.enrolled_count,
+                            'waitlist_count', s.waitlist_count,
+                            'term_id', t.term_id,
+                            'term_name', t.name,
+                            'term_year', t.year,
+                            'instructor_name', CONCAT(u.first_name, ' ', u.last_name),
+                            'instructor_email', u.email
+                        ))
+                        FROM section s
+                        JOIN term t ON s.term_id = t.term_id
+                        LEFT JOIN user_account u ON s.instructor_id = u.user_id
+                        WHERE s.course_id = c.course_id AND t.is_current = 1
+                    ) as sections
+            """ if include_sections else "NULL as sections"
+            
+            query = f"""
                 SELECT 
                     c.course_id,
                     c.course_number,
@@ -102,15 +180,44 @@ class CourseModel:
                     d.name as dept_name,
                     d.description as dept_description,
                     c.created_at,
-                    c.updated_at
+                    c.updated_at,
+                    (
+                        SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                            'course_id', pc.course_id,
+                            'course_number', pc.course_number,
+                            'title', pc.title,
+                            'credits', pc.credits,
+                            'dept_code', pd.code
+                        ))
+                        FROM course_prerequisite cp
+                        JOIN course pc ON cp.prereq_course_id = pc.course_id
+                        JOIN department pd ON pc.dept_id = pd.dept_id
+                        WHERE cp.course_id = c.course_id
+                    ) as prerequisites,
+                    {sections_column}
                 FROM course c
                 JOIN department d ON c.dept_id = d.dept_id
                 WHERE c.course_id = %s
             """
-            return execute_query(query, (course_id,), fetch_one=True)
+            course = execute_query(query, (course_id,), fetch_one=True)
+            
+            if not course:
+                return None
+            
+            # JSON_ARRAYAGG has no ORDER BY, so restore the per-query ordering
+            prerequisites = orjson.loads(course['prerequisites'] or '[]')
+            prerequisites.sort(key=lambda p: (p['dept_code'], p['course_number']))
+            course['prerequisites'] = prerequisites
+            
+            if include_sections:
+                sections = orjson.loads(course['sections'] or '[]')
+                sections.sort(key=lambda s: s['section_number'])
+                course['sections'] = sections
+            
+            return course
             
         except Exception as e:
-            logger.error(f"Error fetching course by ID: {e}")
+            logger.error("Error fetching full course: %s", e)
             return None
     
     @staticmethod
@@ -127,85 +234,49 @@ class CourseModel:
             list: List of matching courses
         """
         try:
-            query = """
-                SELECT 
-                    c.course_id,
-                    c.course_number,
-                    c.title,
-                    c.description,
-                    c.credits,
-                    d.code as dept_code,
-                    d.name as dept_name,
-                    CONCAT(d.code, ' ', c.course_number, ' - ', c.title) as full_title
-                FROM course c
-                JOIN department d ON c.dept_id = d.dept_id
-                WHERE c.is_active = 1
-                AND (
-                    c.title LIKE %s
-                    OR c.course_number LIKE %s
-                    OR c.description LIKE %s
-                    OR d.code LIKE %s
-                )
-            """
-            
             search_pattern = f"%{search_term}%"
-            params = [search_pattern, search_pattern, search_pattern, search_pattern]
+            dept_filter = dept_id or None
             
-            if dept_id:
-                query += " AND c.dept_id = %s"
-                params.append(dept_id)
-            
-            query += " ORDER BY d.code, c.course_number LIMIT %s"
-            params.append(limit)
-            
-            return execute_query(query, tuple(params))
+            return execute_query(_SEARCH_COURSES_QUERY, (
+                search_pattern, search_pattern, search_pattern, search_pattern,
+                dept_filter, dept_filter, limit
+            ))
             
         except Exception as e:
-            logger.error(f"Error searching courses: {e}")
+            logger.error("Error searching courses: %s", e)
             return []
     
     @staticmethod
-    def get_course_prerequisites(course_id):
+    def iter_courses_by_department(dept_code, batch_size=100):
         """
-        Get prerequisites for a course
+        Stream all courses in a department in batches
+        
+        Rows are read from an unbuffered cursor, so memory use does not
+        grow with the size of the department. Database errors propagate to
+        the caller.
         
         Args:
-            course_id (int): Course ID
+            dept_code (str): Department code; matched case-insensitively
+            batch_size (int): Rows fetched per read
             
         Returns:
-            list: List of prerequisite courses
+            generator: Lists of up to batch_size course rows
         """
-        try:
-            query = """
-                SELECT 
-                    c.course_id,
-                    c.course_number,
-                    c.title,
-                    c.credits,
-                    d.code as dept_code,
-                    CONCAT(d.code, ' ', c.course_number) as course_code
-                FROM course_prerequisite cp
-                JOIN course c ON cp.prereq_course_id = c.course_id
-                JOIN department d ON c.dept_id = d.dept_id
-                WHERE cp.course_id = %s
-                ORDER BY d.code, c.course_number
-            """
-            return execute_query(query, (course_id,))
-            
-        except Exception as e:
-            logger.error(f"Error fetching prerequisites: {e}")
-            return []
+        return stream_query(_DEPARTMENT_COURSES_QUERY, (dept_code,), batch_size)
     
     @staticmethod
-    def get_courses_by_department(dept_code):
+    def get_course_with_prereqs(course_id):
         """
-        Get all courses in a department
+        Get a course and its prerequisites in a single query
+        
+        The prerequisites are LEFT JOINed, so a course without any still
+        returns one row, and no row at all means the course does not exist.
         
         Args:
-            dept_code (str): Department code (e.g., 'CMSC')
+            course_id (int): Course ID
             
         Returns:
-            list: List of courses
+            tuple: (dict or None, list) - (course, prerequisite courses)
         """
         try:
             query = """
@@ -213,81 +284,117 @@ class CourseModel:
                     c.course_id,
                     c.course_number,
                     c.title,
-                    c.description,
-                    c.credits,
                     d.code as dept_code,
-                    d.name as dept_name
+                    pc.course_id as prereq_course_id,
+                    pc.course_number as prereq_course_number,
+                    pc.title as prereq_title,
+                    pc.credits as prereq_credits,
+                    pd.code as prereq_dept_code
                 FROM course c
                 JOIN department d ON c.dept_id = d.dept_id
-                WHERE d.code = %s AND c.is_active = 1
-                ORDER BY c.course_number
+                LEFT JOIN course_prerequisite cp ON cp.course_id = c.course_id
+                LEFT JOIN course pc ON cp.prereq_course_id = pc.course_id
+                LEFT JOIN department pd ON pc.dept_id = pd.dept_id
+                WHERE c.course_id = %s
+                ORDER BY pd.code, pc.course_number
             """
-            return execute_query(query, (dept_code.upper(),))
+            rows = execute_query(query, (course_id,))
+            
+            if not rows:
+                return None, []
+            
+            first = rows[0]
+            course = {
+                'course_id': first['course_id'],
+                'course_number': first['course_number'],
+                'title': first['title'],
+                'dept_code': first['dept_code']
+            }
+            prerequisites = [
+                {
+                    'course_id': row['prereq_course_id'],
+                    'course_number': row['prereq_course_number'],
+                    'title': row['prereq_title'],
+                    'credits': row['prereq_credits'],
+                    'dept_code': row['prereq_dept_code']
+                }
+                for row in rows
+                if row['prereq_course_id'] is not None
+            ]
+            
+            return course, prerequisites
             
         except Exception as e:
-            logger.error(f"Error fetching courses by department: {e}")
-            return []
+            logger.error("Error fetching course with prerequisites: %s", e)
+            return None, []
     
     @staticmethod
-    def get_course_sections(course_id, term_id=None):
+    def get_course_with_sections(course_id, term_id=None):
         """
-        Get all sections for a course
+        Get a course and its sections in a single query
+        
+        The sections are LEFT JOINed, so a course without any in the term
+        still returns one row, and no row at all means the course does not
+        exist.
         
         Args:
             course_id (int): Course ID
             term_id (int): Optional term filter (defaults to current term)
             
         Returns:
-            list: List of sections
+            tuple: (dict or None, list) - (course, sections); section rows
+                also carry the course columns
         """
         try:
             query = """
                 SELECT 
+                    c.course_id,
+                    c.course_number,
+                    c.title,
+                    d.code as dept_code,
                     s.section_id,
                     s.section_number,
                     s.capacity,
                     s.location,
                     s.status,
-                    COALESCE(enrolled.count, 0) as enrolled_count,
-                    COALESCE(waitlist.count, 0) as waitlist_count,
+                    s.enrolled_count,
+                    s.waitlist_count,
                     t.term_id,
                     t.name as term_name,
                     t.year as term_year,
                     CONCAT(u.first_name, ' ', u.last_name) as instructor_name,
                     u.email as instructor_email
-                FROM section s
-                JOIN term t ON s.term_id = t.term_id
-                LEFT JOIN user_account u ON s.instructor_id = u.user_id
-                LEFT JOIN (
-                    SELECT section_id, COUNT(*) as count 
-                    FROM enrollment 
-                    WHERE enrollment_status = 'Enrolled'
-                    GROUP BY section_id
-                ) enrolled ON s.section_id = enrolled.section_id
+                FROM course c
+                JOIN department d ON c.dept_id = d.dept_id
                 LEFT JOIN (
-                    SELECT section_id, COUNT(*) as count 
-                    FROM waitlist 
-                    WHERE status = 'Active'
-                    GROUP BY section_id
-                ) waitlist ON s.section_id = waitlist.section_id
-                WHERE s.course_id = %s
+                    section s
+                    JOIN term t ON s.term_id = t.term_id
+                        AND (t.term_id = %s OR (%s IS NULL AND t.is_current = 1))
+                ) ON s.course_id = c.course_id
+                LEFT JOIN user_account u ON s.instructor_id = u.user_id
+                WHERE c.course_id = %s
+                ORDER BY s.section_number
             """
+            term_filter = term_id or None
+            rows = execute_query(query, (term_filter, term_filter, course_id))
             
-            params = [course_id]
-            
-            if term_id:
-                query += " AND s.term_id = %s"
-                params.append(term_id)
-            else:
-                query += " AND t.is_current = 1"
+            if not rows:
+                return None, []
             
-            query += " ORDER BY s.section_number"
+            first = rows[0]
+            course = {
+                'course_id': first['course_id'],
+                'course_number': first['course_number'],
+                'title': first['title'],
+                'dept_code': first['dept_code']
+            }
+            sections = [row for row in rows if row['section_id'] is not None]
             
-            return execute_query(query, tuple(params))
+            return course, sections
             
         except Exception as e:
-            logger.error(f"Error fetching course sections: {e}")
-            return []
+            logger.error("Error fetching course with sections: %s", e)
+            return None, []
     
     @staticmethod
     def get_total_courses(dept_id=None):
@@ -312,7 +419,7 @@ class CourseModel:
             return result['count'] if result else 0
             
         except Exception as e:
-            logger.error(f"Error getting course count: {e}")
+            logger.error("Error getting course count: %s", e)
             return 0
 
 
@@ -343,7 +450,7 @@ class DepartmentModel:
             return execute_query(query)
             
         except Exception as e:
-            logger.error(f"Error fetching departments: {e}")
+            logger.error("Error fetching departments: %s", e)
             return []
     
     @staticmethod
@@ -352,7 +459,8 @@ class DepartmentModel:
         Get department by code
         
         Args:
-            dept_code (str): Department code
+            dept_code (str): Department code; matched case-insensitively
+                by the column collation
             
         Returns:
             dict: Department details or None
@@ -370,8 +478,8 @@ class DepartmentModel:
                 WHERE d.code = %s
                 GROUP BY d.dept_id, d.code, d.name, d.description
             """
-            return execute_query(query, (dept_code.upper(),), fetch_one=True)
+            return execute_query(query, (dept_code,), fetch_one=True)
             
         except Exception as e:
-            logger.error(f"Error fetching department: {e}")
+            logger.error("Error fetching department: %s", e)
             return None
@@ -0,0 +1,147 @@
+"""
+OCRS Backend - Course Query Parameters
+Parsed and validated query-string parameters for course routes
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Optional
+
+_CURSOR_SEPARATOR = '|'
+
+
+def _parse_int(value, default=None):
+    """Convert a query-string value to int, or return default if invalid"""
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def encode_cursor(*values):
+    """
+    Encode the sort key of the last row on a page as an opaque cursor
+
+    Args:
+        *values: Sort key values of the last row
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    raw = _CURSOR_SEPARATOR.join(str(value) for value in values)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(token, size):
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        token (str): Cursor token from the client
+        size (int): Expected number of sort key values
+
+    Returns:
+        list: Sort key values as strings, or None if the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token.encode()).decode()
+    except (binascii.Error, UnicodeError):
+        return None
+
+    values = raw.split(_CURSOR_SEPARATOR, size - 1)
+    return values if len(values) == size else None
+
+
+@dataclass(frozen=True, slots=True)
+class SearchParams:
+    """Parameters for GET /api/courses/search"""
+
+    q: str
+    dept_id: Optional[int] = None
+    limit: int = 50
+
+    MIN_TERM_LENGTH = 2
+    MAX_LIMIT = 100
+
+    @classmethod
+    def from_args(cls, args):
+        """
+        Parse search parameters from the query string
+
+        Args:
+            args (MultiDict): request.args
+
+        Returns:
+            tuple: (SearchParams or None, str) - (params, error_message)
+        """
+        q = args.get('q', '').strip()
+
+        if not q:
+            return None, "Search term is required"
+
+        if len(q) < cls.MIN_TERM_LENGTH:
+            return None, f"Search term must be at least {cls.MIN_TERM_LENGTH} characters"
+
+        limit = _parse_int(args.get('limit'), 50)
+
+        return cls(
+            q=q,
+            dept_id=_parse_int(args.get('dept_id')),
+            limit=min(max(1, limit), cls.MAX_LIMIT),
+        ), ""
+
+
+@dataclass(frozen=True, slots=True)
+class ListParams:
+    """Common query parameters for course routes, parsed once per request"""
+
+    limit: int = 50
+    offset: int = 0
+    cursor: Optional[str] = None
+    include_sections: bool = False
+    term_id: Optional[int] = None
+
+    MAX_LIMIT = 100
+
+    @classmethod
+    def from_multidict(cls, args):
+        """
+        Parse list parameters from the query string in a single pass
+
+        Invalid integers fall back to their defaults, as with
+        MultiDict.get(type=int).
+
+        Args:
+            args (MultiDict): request.args
+
+        Returns:
+            ListParams: Parsed parameters
+        """
+        limit = 50
+        offset = 0
+        cursor = None
+        include_sections = False
+        term_id = None
+
+        for key, value in args.items():
+            if key == 'limit':
+                limit = _parse_int(value, 50)
+            elif key == 'offset':
+                offset = _parse_int(value, 0)
+            elif key == 'cursor':
+                cursor = value
+            elif key == 'include_sections':
+                include_sections = value.lower() == 'true'
+            elif key == 'term_id':
+                term_id = _parse_int(value)
+
+        return cls(
+            limit=min(max(1, limit), cls.MAX_LIMIT),
+            offset=offset,
+            cursor=cursor,
+            include_sections=include_sections,
+            term_id=term_id,
+        )
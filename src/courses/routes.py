@@ -3,15 +3,31 @@ OCRS Backend - Course Routes
 API endpoints for course management
 """
 
-from flask import Blueprint, request
+from itertools import chain
 
+from flask import Blueprint, g, request
+
+from src.courses import search_index
 from src.courses.models import CourseModel, DepartmentModel
+from src.courses.params import ListParams, SearchParams, encode_cursor, decode_cursor
 from src.courses.utils import (
     format_course_response,
-    format_section_response,
+    format_section_list,
     format_department_response,
+    course_list_cache,
+    course_count_cache,
+    course_detail_cache,
+    department_list_cache,
+)
+from src.utils.responses import (
+    success_response,
+    cached_success_response,
+    preencode,
+    stream_success_response,
+    error_response,
+    not_found_response,
 )
-from src.utils.responses import success_response, error_response, not_found_response
+from src.utils.validators import validate_query
 from src.utils.logger import setup_logger
 from src.utils.database import execute_query  # used by get_courses()
 
@@ -21,6 +37,84 @@ logger = setup_logger("ocrs.courses.routes")
 courses_bp = Blueprint("courses", __name__)
 
 
+@courses_bp.before_request
+def _parse_params():
+    """Parse common query parameters once per request into g.params"""
+    g.params = ListParams.from_multidict(request.args)
+
+
+def _count_courses():
+    """Count all courses for listing pagination"""
+    total_row = execute_query(
+        "SELECT COUNT(*) AS total FROM course",
+        fetch_one=True,
+    )
+    return total_row["total"] if total_row else 0
+
+
+def _list_courses(limit, offset=0, after_id=None):
+    """Fetch one page of the course listing, by offset or after a course_id"""
+    # credits is cast server-side so the dict rows returned by the driver
+    # are already in response shape
+    if after_id is not None:
+        # Keyset page: seeks on the primary key instead of scanning `offset` rows
+        return execute_query(
+            """
+            SELECT
+                course_id,
+                title,
+                CAST(credits AS DOUBLE) AS credits
+            FROM course
+            WHERE course_id > %s
+            ORDER BY course_id
+            LIMIT %s
+            """,
+            (after_id, limit),
+        )
+
+    return execute_query(
+        """
+        SELECT
+            course_id,
+            title,
+            CAST(credits AS DOUBLE) AS credits
+        FROM course
+        ORDER BY course_id
+        LIMIT %s OFFSET %s
+        """,
+        (limit, offset),
+    )
+
+
+def _list_departments():
+    """Fetch, format and encode all departments with their ETag, or None if none"""
+    formatted_depts = [
+        format_department_response(dept)
+        for dept in DepartmentModel.get_all_departments()
+    ]
+
+    if not formatted_depts:
+        return None
+
+    return preencode({"departments": formatted_depts})
+
+
+def _load_course_detail(course_id, include_sections=False):
+    """Fetch and format a course with its prerequisites, or None if not found"""
+    # Course, prerequisites and (optionally) sections in one round-trip
+    course = CourseModel.get_course_full(course_id, include_sections=include_sections)
+
+    if not course:
+        return None
+
+    return format_course_response(
+        course,
+        include_sections=include_sections,
+        sections=course["sections"],
+        prerequisites=course["prerequisites"],
+    )
+
+
 @courses_bp.route("/", methods=["GET"])
 def get_courses():
     """
@@ -41,52 +135,56 @@ def get_courses():
         in: query
         type: integer
         default: 0
-        description: Pagination offset
+        description: Pagination offset (ignored when cursor is given)
+      - name: cursor
+        in: query
+        type: string
+        description: next_cursor from the previous page
     responses:
       200:
         description: List of courses
+      400:
+        description: Invalid pagination cursor
     """
     try:
-        # Basic pagination
-        limit = request.args.get("limit", 50, type=int)
-        offset = request.args.get("offset", 0, type=int)
-
-        if limit is None:
-            limit = 50
-        # clamp between 1 and 100
-        limit = min(max(1, limit), 100)
-
-        # 1) total count
-        total_row = execute_query(
-            "SELECT COUNT(*) AS total FROM course",
-            fetch_one=True,
-        )
-        total = total_row["total"] if total_row else 0
-
-        # 2) actual rows
-        rows = execute_query(
-            """
-            SELECT
-                course_id,
-                title,
-                credits
-            FROM course
-            ORDER BY course_id
-            LIMIT %s OFFSET %s
-            """,
-            (limit, offset),
+        # Basic pagination (limit is clamped between 1 and 100)
+        params = g.params
+        limit = params.limit
+        offset = params.offset
+        cursor = params.cursor
+
+        after_id = None
+        if cursor:
+            values = decode_cursor(cursor, 1)
+            if not values or not values[0].isdigit():
+                return error_response("Invalid pagination cursor", 400)
+            after_id = int(values[0])
+
+        # 1) total count (cached per department filter; None = all)
+        total = course_count_cache.get_or_load(None, _count_courses)
+
+        # 2) actual rows (cached per page)
+        if after_id is not None:
+            # One row past the page tells whether another page follows
+            rows = course_list_cache.get_or_load(
+                ("after", limit, after_id),
+                lambda: _list_courses(limit + 1, after_id=after_id),
+            )
+            has_more = len(rows) > limit
+            formatted_courses = rows[:limit]
+        else:
+            formatted_courses = course_list_cache.get_or_load(
+                ("list", limit, offset),
+                lambda: _list_courses(limit, offset),
+            )
+            has_more = (offset + limit) < total
+
+        next_cursor = (
+            encode_cursor(formatted_courses[-1]["course_id"])
+            if has_more and formatted_courses
+            else None
         )
 
-        # 3) format results
-        formatted_courses = [
-            {
-                "course_id": row["course_id"],
-                "title": row["title"],
-                "credits": float(row.get("credits", 0)),
-            }
-            for row in rows
-        ]
-
         return success_response(
             data={
                 "courses": formatted_courses,
@@ -94,13 +192,14 @@ def get_courses():
                     "total": total,
                     "limit": limit,
                     "offset": offset,
-                    "has_more": (offset + limit) < total,
+                    "has_more": has_more,
+                    "next_cursor": next_cursor,
                 },
             }
         )
 
     except Exception as e:
-        logger.error(f"Error fetching courses (simple query): {e}")
+        logger.error("Error fetching courses (simple query): %s", e)
         return error_response("An error occurred while fetching courses", 500)
 
 
@@ -129,41 +228,33 @@ def get_course(course_id):
         description: Course not found
     """
     try:
-        include_sections = (
-            request.args.get("include_sections", "false").lower() == "true"
-        )
+        if g.params.include_sections:
+            # Section counts change with every enrollment; always read fresh
+            # and keep the response out of browser and proxy caches
+            formatted_course = _load_course_detail(course_id, include_sections=True)
 
-        # Get course
-        course = CourseModel.get_course_by_id(course_id)
+            if not formatted_course:
+                return not_found_response("Course not found")
 
-        if not course:
-            return not_found_response("Course not found")
-
-        # Get prerequisites
-        prerequisites = CourseModel.get_course_prerequisites(course_id)
-
-        # Get sections if requested
-        sections = None
-        if include_sections:
-            sections = CourseModel.get_course_sections(course_id)
+            return success_response(data=formatted_course)
 
-        # Format response
-        formatted_course = format_course_response(
-            course,
-            include_sections=include_sections,
-            sections=sections,
-            prerequisites=prerequisites,
+        formatted_course = course_detail_cache.get_or_load(
+            ("detail", course_id), lambda: _load_course_detail(course_id)
         )
 
-        return success_response(data=formatted_course)
+        if not formatted_course:
+            return not_found_response("Course not found")
+
+        return cached_success_response(formatted_course)
 
     except Exception as e:
-        logger.error(f"Error fetching course {course_id}: {e}")
+        logger.error("Error fetching course %s: %s", course_id, e)
         return error_response("An error occurred while fetching course", 500)
 
 
 @courses_bp.route("/search", methods=["GET"])
-def search_courses():
+@validate_query(SearchParams.from_args)
+def search_courses(params):
     """
     Search courses by keyword
     ---
@@ -191,34 +282,21 @@ def search_courses():
         description: Missing search term
     """
     try:
-        search_term = request.args.get("q", "").strip()
-
-        if not search_term:
-            return error_response("Search term is required", 400)
-
-        if len(search_term) < 2:
-            return error_response("Search term must be at least 2 characters", 400)
-
-        dept_id = request.args.get("dept_id", type=int)
-        limit = request.args.get("limit", 50, type=int)
-        limit = min(max(1, limit), 100)
-
-        # Search courses
-        courses = CourseModel.search_courses(search_term, dept_id=dept_id, limit=limit)
-
-        # Format response
-        formatted_courses = [format_course_response(course) for course in courses]
+        # Search courses (already formatted by the index)
+        formatted_courses = search_index.search_courses(
+            params.q, dept_id=params.dept_id, limit=params.limit
+        )
 
         return success_response(
             data={
                 "courses": formatted_courses,
-                "search_term": search_term,
+                "search_term": params.q,
                 "result_count": len(formatted_courses),
             }
         )
 
     except Exception as e:
-        logger.error(f"Error searching courses: {e}")
+        logger.error("Error searching courses: %s", e)
         return error_response("An error occurred during search", 500)
 
 
@@ -242,20 +320,17 @@ def get_prerequisites(course_id):
         description: Course not found
     """
     try:
-        # Check if course exists
-        course = CourseModel.get_course_by_id(course_id)
+        # Course and prerequisites in one round-trip; no course row means 404
+        course, prerequisites = CourseModel.get_course_with_prereqs(course_id)
 
         if not course:
             return not_found_response("Course not found")
 
-        # Get prerequisites
-        prerequisites = CourseModel.get_course_prerequisites(course_id)
-
         # Format response
         formatted_prereqs = [
             {
                 "course_id": prereq.get("course_id"),
-                "course_code": prereq.get("course_code"),
+                "course_code": f"{prereq.get('dept_code')} {prereq.get('course_number')}",
                 "title": prereq.get("title"),
                 "credits": float(prereq.get("credits", 0)),
             }
@@ -274,7 +349,7 @@ def get_prerequisites(course_id):
         )
 
     except Exception as e:
-        logger.error(f"Error fetching prerequisites: {e}")
+        logger.error("Error fetching prerequisites: %s", e)
         return error_response("An error occurred", 500)
 
 
@@ -302,21 +377,18 @@ def get_course_sections(course_id):
         description: Course not found
     """
     try:
-        term_id = request.args.get("term_id", type=int)
+        term_id = g.params.term_id
 
-        # Check if course exists
-        course = CourseModel.get_course_by_id(course_id)
+        # Course and sections in one round-trip; no course row means 404
+        course, sections = CourseModel.get_course_with_sections(
+            course_id, term_id=term_id
+        )
 
         if not course:
             return not_found_response("Course not found")
 
-        # Get sections
-        sections = CourseModel.get_course_sections(course_id, term_id=term_id)
-
         # Format response
-        formatted_sections = [
-            format_section_response(section) for section in sections
-        ]
+        formatted_sections = format_section_list(sections)
 
         return success_response(
             data={
@@ -331,7 +403,7 @@ def get_course_sections(course_id):
         )
 
     except Exception as e:
-        logger.error(f"Error fetching sections: {e}")
+        logger.error("Error fetching sections: %s", e)
         return error_response("An error occurred", 500)
 
 
@@ -347,15 +419,17 @@ def get_departments():
         description: List of departments
     """
     try:
-        departments = DepartmentModel.get_all_departments()
+        # Formatting, serialization and the ETag happen once per cache fill
+        cached = department_list_cache.get_or_load("all", _list_departments)
 
-        # Format response
-        formatted_depts = [format_department_response(dept) for dept in departments]
+        if cached is None:
+            return success_response(data={"departments": []})
 
-        return success_response(data={"departments": formatted_depts})
+        data, etag = cached
+        return cached_success_response(data, etag=etag)
 
     except Exception as e:
-        logger.error(f"Error fetching departments: {e}")
+        logger.error("Error fetching departments: %s", e)
         return error_response("An error occurred", 500)
 
 
@@ -385,20 +459,21 @@ def get_department_courses(dept_code):
         if not department:
             return not_found_response("Department not found")
 
-        # Get courses
-        courses = CourseModel.get_courses_by_department(dept_code)
+        data = {"department": format_department_response(department)}
 
-        # Format response
-        formatted_courses = [format_course_response(course) for course in courses]
+        # Run the query and read the first batch before the response starts,
+        # so a failing query still returns a 500
+        batches = CourseModel.iter_courses_by_department(dept_code)
+        first_batch = next(batches, [])
 
-        return success_response(
-            data={
-                "department": format_department_response(department),
-                "courses": formatted_courses,
-                "course_count": len(formatted_courses),
-            }
+        # Stream the rest straight from the cursor into the response body
+        return stream_success_response(
+            data,
+            "courses",
+            map(format_course_response, chain(first_batch, chain.from_iterable(batches))),
+            count_key="course_count",
         )
 
     except Exception as e:
-        logger.error(f"Error fetching department courses: {e}")
+        logger.error("Error fetching department courses: %s", e)
         return error_response("An error occurred", 500)
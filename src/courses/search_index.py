@@ -0,0 +1,134 @@
+"""
+OCRS Backend - Course Search Index
+In-memory catalog index for keyword search
+"""
+
+import threading
+
+from src.courses.models import CourseModel
+from src.courses.utils import course_search_cache, format_course_list
+from src.utils.logger import setup_logger
+
+logger = setup_logger('ocrs.courses.search_index')
+
+# Concurrent misses wait for one build instead of each loading the catalog
+_BUILD_LOCK = threading.Lock()
+
+
+class CourseSearchIndex:
+    """
+    Active course catalog held in memory for keyword search
+
+    Matches the SQL search it replaces: a case-insensitive substring match
+    against title, course number, description or department code, returned
+    in (department code, course number) order. Courses are formatted once
+    when the index is built, so results are ready to serialize.
+    """
+
+    def __init__(self, courses):
+        """
+        Args:
+            courses (list): Active course rows ordered by dept code, course number
+        """
+        self._courses = format_course_list(courses)
+        self._dept_ids = [course['dept_id'] for course in courses]
+        # One lowercased haystack per course; NUL keeps matches within a field
+        self._haystacks = [
+            '\0'.join((
+                course['title'] or '',
+                course['course_number'] or '',
+                course['description'] or '',
+                course['dept_code'] or '',
+            )).casefold()
+            for course in courses
+        ]
+
+        # Every trigram in the catalog; a term containing any other trigram
+        # cannot match, so it is answered without scanning
+        self._trigrams = {
+            haystack[i:i + 3]
+            for haystack in self._haystacks
+            for i in range(len(haystack) - 2)
+        }
+
+    def search(self, search_term, dept_id=None, limit=50):
+        """
+        Search the catalog
+
+        Args:
+            search_term (str): Search term
+            dept_id (int): Optional department filter
+            limit (int): Maximum results
+
+        Returns:
+            list: Formatted matching courses
+        """
+        needle = search_term.casefold()
+        results = []
+
+        if not self.may_contain(needle):
+            return results
+
+        for course, course_dept_id, haystack in zip(
+            self._courses, self._dept_ids, self._haystacks
+        ):
+            if needle in haystack and (not dept_id or course_dept_id == dept_id):
+                results.append(course)
+                if len(results) >= limit:
+                    break
+
+        return results
+
+    def may_contain(self, needle):
+        """
+        Check whether a casefolded term can occur anywhere in the catalog
+
+        Args:
+            needle (str): Casefolded search term
+
+        Returns:
+            bool: False if some trigram of the term appears in no course
+        """
+        trigrams = self._trigrams
+        return all(needle[i:i + 3] in trigrams for i in range(len(needle) - 2))
+
+
+def _build_index():
+    """Load the active catalog and build the index, or None if unavailable"""
+    courses = CourseModel.get_all_courses(limit=None)
+
+    if not courses:
+        return None
+
+    logger.info("Course search index built with %s courses", len(courses))
+    return CourseSearchIndex(courses)
+
+
+def _build_index_once():
+    """Build the index, or return the one another request just built"""
+    with _BUILD_LOCK:
+        return course_search_cache.get_or_load('catalog', _build_index)
+
+
+def search_courses(search_term, dept_id=None, limit=50):
+    """
+    Search courses, using the in-memory index when available
+
+    Falls back to the SQL search if the catalog could not be loaded.
+
+    Args:
+        search_term (str): Search term
+        dept_id (int): Optional department filter
+        limit (int): Maximum results
+
+    Returns:
+        list: Formatted matching courses
+    """
+    index = course_search_cache.get_or_load('catalog', _build_index_once)
+
+    if index is None:
+        return format_course_list(
+            CourseModel.search_courses(search_term, dept_id=dept_id, limit=limit)
+        )
+
+    return index.search(search_term, dept_id=dept_id, limit=limit)
@@ -3,12 +3,80 @@ OCRS Backend - Course Utilities
 Helper functions for course management
 """
 
+from operator import itemgetter
+from typing import Any, Callable, Optional
+
+from src.utils.cache import VersionedTTLCache
 from src.utils.logger import setup_logger
 
 logger = setup_logger('ocrs.courses.utils')
 
+# Per-process catalog caches. A course write clears them only in the worker
+# that made it (see invalidate_course_caches); every other worker keeps
+# serving its copies, so catalog data may be stale for up to each TTL.
+course_list_cache = VersionedTTLCache(maxsize=512, ttl=60)
+course_count_cache = VersionedTTLCache(maxsize=128, ttl=30)
+department_list_cache = VersionedTTLCache(maxsize=1, ttl=300)
+course_search_cache = VersionedTTLCache(maxsize=1, ttl=300)
+# Formatted single courses without sections, keyed by ('detail', course_id)
+course_detail_cache = VersionedTTLCache(maxsize=4096, ttl=300)
+
+# Column projections used by the formatters, with defaults for rows from
+# queries that do not select every column
+_COURSE_KEYS = (
+    'course_id', 'course_number', 'title', 'description', 'credits',
+    'dept_id', 'dept_code', 'dept_name', 'is_active'
+)
+_COURSE_DEFAULTS = (None, None, None, None, 0, None, None, None, 1)
+_COURSE_FIELDS = itemgetter(*_COURSE_KEYS)
+
+_SECTION_KEYS = (
+    'section_id', 'section_number', 'capacity', 'enrolled_count',
+    'waitlist_count', 'location', 'status', 'term_id', 'term_name',
+    'term_year', 'instructor_name', 'instructor_email'
+)
+_SECTION_DEFAULTS = (None, None, 0, 0, 0, None, None, None, None, None, None, None)
+_SECTION_FIELDS = itemgetter(*_SECTION_KEYS)
+
+_DEPARTMENT_KEYS = ('dept_id', 'code', 'name', 'description', 'course_count')
+_DEPARTMENT_DEFAULTS = (None, None, None, None, 0)
+_DEPARTMENT_FIELDS = itemgetter(*_DEPARTMENT_KEYS)
+
+# Module-level alias saves a builtins lookup per row in the formatters
+_float = float
+
 
-def format_course_response(course, include_sections=False, sections=None, prerequisites=None):
+def _project(
+    row: dict[str, Any],
+    fields: Callable[[dict[str, Any]], Any],
+    keys: tuple[str, ...],
+    defaults: tuple[Any, ...],
+) -> tuple[Any, ...]:
+    """
+    Fetch the projected columns of a row as a tuple
+    
+    Args:
+        row (dict): Database row
+        fields (operator.itemgetter): Getter for keys
+        keys (tuple): Column names
+        defaults (tuple): Values for columns missing from the row
+        
+    Returns:
+        tuple: Column values in keys order
+    """
+    try:
+        return fields(row)
+    except KeyError:
+        get = row.get
+        return tuple(get(key, default) for key, default in zip(keys, defaults))
+
+
+def format_course_response(
+    course: Optional[dict[str, Any]],
+    include_sections: bool = False,
+    sections: Optional[list[dict[str, Any]]] = None,
+    prerequisites: Optional[list[dict[str, Any]]] = None,
+) -> Optional[dict[str, Any]]:
     """
     Format course data for API response
     
@@ -24,19 +92,24 @@ def format_course_response(course, include_sections=False, sections=None, prereq
     if not course:
         return None
     
-    formatted = {
-        'course_id': course.get('course_id'),
-        'course_number': course.get('course_number'),
-        'title': course.get('title'),
-        'description': course.get('description'),
-        'credits': float(course.get('credits', 0)),
+    (course_id, course_number, title, description, credits,
+     dept_id, dept_code, dept_name, is_active) = _project(
+        course, _COURSE_FIELDS, _COURSE_KEYS, _COURSE_DEFAULTS
+    )
+    
+    formatted: dict[str, Any] = {
+        'course_id': course_id,
+        'course_number': course_number,
+        'title': title,
+        'description': description,
+        'credits': _float(credits or 0),
         'department': {
-            'dept_id': course.get('dept_id'),
-            'code': course.get('dept_code'),
-            'name': course.get('dept_name')
+            'dept_id': dept_id,
+            'code': dept_code,
+            'name': dept_name
         },
-        'full_course_code': f"{course.get('dept_code')} {course.get('course_number')}",
-        'is_active': bool(course.get('is_active', 1))
+        'full_course_code': f"{dept_code} {course_number}",
+        'is_active': is_active != 0
     }
     
     # Add prerequisites if provided
@@ -44,7 +117,7 @@ def format_course_response(course, include_sections=False, sections=None, prereq
         formatted['prerequisites'] = [
             {
                 'course_id': prereq.get('course_id'),
-                'course_code': prereq.get('course_code'),
+                'course_code': f"{prereq.get('dept_code')} {prereq.get('course_number')}",
                 'title': prereq.get('title')
             }
             for prereq in prerequisites
@@ -52,15 +125,52 @@ def format_course_response(course, include_sections=False, sections=None, prereq
     
     # Add sections if provided
     if include_sections and sections is not None:
-        formatted['sections'] = [
-            format_section_response(section)
-            for section in sections
-        ]
+        formatted['sections'] = format_section_list(sections)
     
     return formatted
 
 
-def format_section_response(section):
+def format_course_list(courses: list[dict[str, Any]]) -> list[Optional[dict[str, Any]]]:
+    """
+    Format a list of course rows for API response
+    
+    Rows from one query share a shape, so each row is unpacked with a single
+    itemgetter call. Rows missing any projected column fall back to
+    format_course_response.
+    
+    Args:
+        courses (list): Course rows
+        
+    Returns:
+        list: Formatted course data
+    """
+    formatted: list[Optional[dict[str, Any]]] = []
+    append = formatted.append
+    
+    try:
+        for (course_id, course_number, title, description, credits,
+             dept_id, dept_code, dept_name, is_active) in map(_COURSE_FIELDS, courses):
+            append({
+                'course_id': course_id,
+                'course_number': course_number,
+                'title': title,
+                'description': description,
+                'credits': _float(credits or 0),
+                'department': {
+                    'dept_id': dept_id,
+                    'code': dept_code,
+                    'name': dept_name
+                },
+                'full_course_code': f"{dept_code} {course_number}",
+                'is_active': is_active != 0
+            })
+    except KeyError:
+        return list(map(format_course_response, courses))
+    
+    return formatted
+
+
+def format_section_response(section: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
     """
     Format section data for API response
     
@@ -73,34 +183,78 @@ def format_section_response(section):
     if not section:
         return None
     
-    enrolled = section.get('enrolled_count', 0)
-    capacity = section.get('capacity', 0)
-    available_seats = max(0, capacity - enrolled)
-    is_full = enrolled >= capacity
+    (section_id, section_number, capacity, enrolled, waitlist_count,
+     location, status, term_id, term_name, term_year,
+     instructor_name, instructor_email) = _project(
+        section, _SECTION_FIELDS, _SECTION_KEYS, _SECTION_DEFAULTS
+    )
     
     return {
-        'section_id': section.get('section_id'),
-        'section_number': section.get('section_number'),
+        'section_id': section_id,
+        'section_number': section_number,
         'capacity': capacity,
         'enrolled_count': enrolled,
-        'available_seats': available_seats,
-        'waitlist_count': section.get('waitlist_count', 0),
-        'is_full': is_full,
-        'location': section.get('location'),
-        'status': section.get('status'),
+        'available_seats': capacity - enrolled if capacity > enrolled else 0,
+        'waitlist_count': waitlist_count,
+        'is_full': enrolled >= capacity,
+        'location': location,
+        'status': status,
         'term': {
-            'term_id': section.get('term_id'),
-            'name': section.get('term_name'),
-            'year': section.get('term_year')
+            'term_id': term_id,
+            'name': term_name,
+            'year': term_year
         },
         'instructor': {
-            'name': section.get('instructor_name'),
-            'email': section.get('instructor_email')
-        } if section.get('instructor_name') else None
+            'name': instructor_name,
+            'email': instructor_email
+        } if instructor_name else None
     }
 
 
-def format_department_response(department):
+def format_section_list(sections: list[dict[str, Any]]) -> list[Optional[dict[str, Any]]]:
+    """
+    Format a list of section rows for API response
+    
+    Args:
+        sections (list): Section rows
+        
+    Returns:
+        list: Formatted section data
+    """
+    formatted: list[Optional[dict[str, Any]]] = []
+    append = formatted.append
+    
+    try:
+        for (section_id, section_number, capacity, enrolled, waitlist_count,
+             location, status, term_id, term_name, term_year,
+             instructor_name, instructor_email) in map(_SECTION_FIELDS, sections):
+            append({
+                'section_id': section_id,
+                'section_number': section_number,
+                'capacity': capacity,
+                'enrolled_count': enrolled,
+                'available_seats': capacity - enrolled if capacity > enrolled else 0,
+                'waitlist_count': waitlist_count,
+                'is_full': enrolled >= capacity,
+                'location': location,
+                'status': status,
+                'term': {
+                    'term_id': term_id,
+                    'name': term_name,
+                    'year': term_year
+                },
+                'instructor': {
+                    'name': instructor_name,
+                    'email': instructor_email
+                } if instructor_name else None
+            })
+    except KeyError:
+        return list(map(format_section_response, sections))
+    
+    return formatted
+
+
+def format_department_response(department: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
     """
     Format department data for API response
     
@@ -113,10 +267,29 @@ def format_department_response(department):
     if not department:
         return None
     
+    dept_id, code, name, description, course_count = _project(
+        department, _DEPARTMENT_FIELDS, _DEPARTMENT_KEYS, _DEPARTMENT_DEFAULTS
+    )
+    
     return {
-        'dept_id': department.get('dept_id'),
-        'code': department.get('code'),
-        'name': department.get('name'),
-        'description': department.get('description'),
-        'course_count': department.get('course_count', 0)
+        'dept_id': dept_id,
+        'code': code,
+        'name': name,
+        'description': description,
+        'course_count': course_count
     }
+
+
+def invalidate_course_caches() -> None:
+    """
+    Clear this process's cached catalog data after a course write
+    
+    Department listings include course counts and the search index holds
+    course rows, so they are cleared too. Other worker processes are not
+    reached; their caches expire on their own TTLs.
+    """
+    course_list_cache.invalidate()
+    course_count_cache.invalidate()
+    department_list_cache.invalidate()
+    course_search_cache.invalidate()
+    course_detail_cache.invalidate()
@@ -3,12 +3,17 @@ OCRS Backend - Enrollment Models
 Database operations for enrollment management
 """
 
-from src.utils.database import execute_query, execute_update, get_db_cursor
+import orjson
+from mysql.connector import Error, errorcode
+from src.utils.database import execute_prepared, execute_query, execute_update, get_db_cursor
 from src.utils.logger import setup_logger
 from datetime import datetime
 
 logger = setup_logger('ocrs.enrollments.models')
 
+# Duplicate position or deadlock victim: a concurrent waitlist add won
+_WAITLIST_RETRY_ERRNOS = (errorcode.ER_DUP_ENTRY, errorcode.ER_LOCK_DEADLOCK)
+
 
 class EnrollmentModel:
     """Enrollment database operations"""
@@ -27,58 +32,56 @@ class EnrollmentModel:
         """
         try:
             with get_db_cursor() as (conn, cursor):
-                # Check if already enrolled
-                cursor.execute("""
-                    SELECT enrollment_id, enrollment_status 
-                    FROM enrollment 
-                    WHERE student_id = %s AND section_id = %s
-                """, (student_id, section_id))
-                
-                existing = cursor.fetchone()
-                if existing:
-                    if existing['enrollment_status'] == 'Enrolled':
-                        return {'error': 'Already enrolled in this section', 'code': 'ALREADY_ENROLLED'}
-                    elif existing['enrollment_status'] == 'Dropped':
-                        # Re-enroll
-                        cursor.execute("""
-                            UPDATE enrollment 
-                            SET enrollment_status = 'Enrolled', enrollment_date = NOW()
-                            WHERE enrollment_id = %s
-                        """, (existing['enrollment_id'],))
-                        return EnrollmentModel.get_enrollment_by_id(existing['enrollment_id'])
-                
-                # Check section capacity
+                # Section capacity and any existing enrollment in one round-trip.
+                # Locking the section row serializes enrollments per section
+                # until this transaction commits.
                 cursor.execute("""
-                    SELECT s.capacity, s.status,
-                           COALESCE(COUNT(e.enrollment_id), 0) as enrolled_count
+                    SELECT s.capacity, s.status, s.enrolled_count,
+                           ex.enrollment_id as existing_id,
+                           ex.enrollment_status as existing_status
                     FROM section s
-                    LEFT JOIN enrollment e ON s.section_id = e.section_id 
-                        AND e.enrollment_status = 'Enrolled'
+                    LEFT JOIN enrollment ex ON ex.section_id = s.section_id
+                        AND ex.student_id = %s
                     WHERE s.section_id = %s
-                    GROUP BY s.section_id, s.capacity, s.status
-                """, (section_id,))
+                    FOR UPDATE OF s
+                """, (student_id, section_id))
                 
                 section = cursor.fetchone()
                 if not section:
                     return {'error': 'Section not found', 'code': 'SECTION_NOT_FOUND'}
                 
+                if section['existing_status'] == 'Enrolled':
+                    return {'error': 'Already enrolled in this section', 'code': 'ALREADY_ENROLLED'}
+                
                 if section['status'] != 'Scheduled':
                     return {'error': 'Section is not available for enrollment', 'code': 'SECTION_UNAVAILABLE'}
                 
                 if section['enrolled_count'] >= section['capacity']:
                     return {'error': 'Section is full', 'code': 'SECTION_FULL'}
                 
-                # Insert enrollment
-                cursor.execute("""
-                    INSERT INTO enrollment (student_id, section_id, enrollment_status)
-                    VALUES (%s, %s, 'Enrolled')
-                """, (student_id, section_id))
-                
-                enrollment_id = cursor.lastrowid
-                
-                logger.info(f"Student {student_id} enrolled in section {section_id}")
-                return EnrollmentModel.get_enrollment_by_id(enrollment_id)
-                
+                if section['existing_status'] == 'Dropped':
+                    # Re-enroll
+                    cursor.execute("""
+                        UPDATE enrollment 
+                        SET enrollment_status = 'Enrolled', enrollment_date = NOW()
+                        WHERE enrollment_id = %s
+                    """, (section['existing_id'],))
+                    enrollment_id = section['existing_id']
+                else:
+                    # Capacity was checked under the section lock above. The
+                    # INSERT must not read section: the enrollment triggers
+                    # update section.enrolled_count, which MySQL refuses
+                    # (error 1442) for a table the statement itself reads.
+                    cursor.execute("""
+                        INSERT INTO enrollment (student_id, section_id, enrollment_status)
+                        VALUES (%s, %s, 'Enrolled')
+                    """, (student_id, section_id))
+                    
+                    enrollment_id = cursor.lastrowid
+            
+            logger.info(f"Student {student_id} enrolled in section {section_id}")
+            return EnrollmentModel.get_enrollment_by_id(enrollment_id)
+            
         except Exception as e:
             logger.error(f"Error enrolling student: {e}")
             return {'error': 'Failed to enroll student', 'code': 'ENROLLMENT_FAILED'}
@@ -115,36 +118,67 @@ class EnrollmentModel:
             return False
     
     @staticmethod
-    def get_student_enrollments(student_id, term_id=None):
+    def get_student_enrollment_payloads(student_id, term_id=None):
         """
-        Get all enrollments for a student
+        Get all enrollments for a student as pre-built JSON
+        
+        Each row's payload is the format_enrollment_response shape plus the
+        section's meeting times, built by MySQL with JSON_OBJECT and ready
+        to embed in a response unparsed.
+        Status and credits are also returned as plain columns for filtering
+        and totals.
         
         Args:
             student_id (int): Student profile ID
             term_id (int): Optional term filter
             
         Returns:
-            list: List of enrollments
+            list: Rows with 'payload' (JSON text), 'enrollment_status' and
+                'credits'
         """
         try:
             query = """
                 SELECT 
-                    e.enrollment_id,
-                    e.enrollment_date,
                     e.enrollment_status,
-                    e.grade,
-                    s.section_id,
-                    s.section_number,
-                    s.location,
-                    c.course_id,
-                    c.course_number,
-                    c.title as course_title,
                     c.credits,
-                    d.code as dept_code,
-                    t.term_id,
-                    t.name as term_name,
-                    t.year as term_year,
-                    CONCAT(u.first_name, ' ', u.last_name) as instructor_name
+                    JSON_OBJECT(
+                        'enrollment_id', e.enrollment_id,
+                        'enrollment_date', CAST(e.enrollment_date AS CHAR),
+                        'status', e.enrollment_status,
+                        'grade', e.grade,
+                        'section', JSON_OBJECT(
+                            'section_id', s.section_id,
+                            'section_number', s.section_number,
+                            'location', s.location
+                        ),
+                        'course', JSON_OBJECT(
+                            'course_id', c.course_id,
+                            'course_code', CONCAT(d.code, ' ', c.course_number),
+                            'title', c.title,
+                            'credits', CAST(c.credits AS DOUBLE)
+                        ),
+                        'term', JSON_OBJECT(
+                            'term_id', t.term_id,
+                            'name', t.name,
+                            'year', t.year
+                        ),
+                        'instructor', CONCAT(u.first_name, ' ', u.last_name),
+                        'meetings', COALESCE((
+                            -- JSON_ARRAYAGG has no ORDER BY; GROUP_CONCAT
+                            -- keeps meetings in weekday order (the day_of_week
+                            -- ENUM sorts Monday..Sunday), then start time
+                            SELECT CAST(CONCAT('[', GROUP_CONCAT(
+                                JSON_OBJECT(
+                                    'day', ss.day_of_week,
+                                    'start', CAST(ss.start_time AS CHAR),
+                                    'end', CAST(ss.end_time AS CHAR)
+                                )
+                                ORDER BY ss.day_of_week, ss.start_time
+                            ), ']') AS JSON)
+                            FROM section_schedule ss
+                            WHERE ss.section_id = s.section_id
+                        ), JSON_ARRAY())
+                    ) as payload
                 FROM enrollment e
                 JOIN section s ON e.section_id = s.section_id
                 JOIN course c ON s.course_id = c.course_id
@@ -165,7 +199,7 @@ class EnrollmentModel:
             return execute_query(query, tuple(params))
             
         except Exception as e:
-            logger.error(f"Error fetching student enrollments: {e}")
+            logger.error(f"Error fetching student enrollment payloads: {e}")
             return []
     
     @staticmethod
@@ -200,141 +234,113 @@ class EnrollmentModel:
                 JOIN department d ON c.dept_id = d.dept_id
                 WHERE e.enrollment_id = %s
             """
-            return execute_query(query, (enrollment_id,), fetch_one=True)
+            return execute_prepared(query, (enrollment_id,), fetch_one=True)
             
         except Exception as e:
             logger.error(f"Error fetching enrollment: {e}")
             return None
     
     @staticmethod
-    def check_schedule_conflict(student_id, section_id):
+    def validate_enrollment_bulk(student_id, section_id, course_id, term_id):
         """
-        Check if enrolling in a section creates a schedule conflict
+        Gather everything enrollment validation needs in a single query
         
-        Args:
-            student_id (int): Student profile ID
-            section_id (int): Section ID to check
-            
-        Returns:
-            dict: Conflict information or None if no conflict
-        """
-        try:
-            query = """
-                SELECT 
-                    c.title as conflicting_course,
-                    s.section_number as conflicting_section,
-                    ss1.day_of_week,
-                    ss1.start_time,
-                    ss1.end_time
-                FROM section_schedule ss1
-                JOIN section s ON ss1.section_id = s.section_id
-                JOIN course c ON s.course_id = c.course_id
-                JOIN enrollment e ON s.section_id = e.section_id
-                WHERE e.student_id = %s 
-                AND e.enrollment_status = 'Enrolled'
-                AND EXISTS (
-                    SELECT 1 
-                    FROM section_schedule ss2
-                    WHERE ss2.section_id = %s
-                    AND ss2.day_of_week = ss1.day_of_week
-                    AND (
-                        (ss2.start_time < ss1.end_time AND ss2.end_time > ss1.start_time)
-                    )
-                )
-                LIMIT 1
-            """
-            return execute_query(query, (student_id, section_id), fetch_one=True)
-            
-        except Exception as e:
-            logger.error(f"Error checking schedule conflict: {e}")
-            return None
-    
-    @staticmethod
-    def check_prerequisites(student_id, course_id):
-        """
-        Check if student has completed prerequisites for a course
+        Missing prerequisites, a schedule conflict, the student's current
+        term credits and the course credits come back as scalar subqueries
+        over the course row.
         
         Args:
             student_id (int): Student profile ID
-            course_id (int): Course ID
+            section_id (int): Section ID to enroll in
+            course_id (int): Course ID of the section
+            term_id (int): Term ID of the section
             
         Returns:
-            dict: Missing prerequisites or None if all met
+            dict: 'course_found', 'course_credits', 'missing_prerequisites'
+                (list), 'conflict' (dict or None) and 'current_credits',
+                or None on error
         """
         try:
             query = """
                 SELECT 
-                    c.course_id,
-                    c.title,
-                    CONCAT(d.code, ' ', c.course_number) as course_code
-                FROM course_prerequisite cp
-                JOIN course c ON cp.prereq_course_id = c.course_id
-                JOIN department d ON c.dept_id = d.dept_id
-                WHERE cp.course_id = %s
-                AND NOT EXISTS (
-                    SELECT 1 
-                    FROM enrollment e
-                    JOIN section s ON e.section_id = s.section_id
-                    WHERE e.student_id = %s
-                    AND s.course_id = cp.prereq_course_id
-                    AND e.enrollment_status = 'Enrolled'
-                    AND (e.grade IS NULL OR e.grade IN ('A', 'B', 'C', 'D', 'P'))
-                )
+                    c.credits as course_credits,
+                    (
+                        SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                            'course_id', pc.course_id,
+                            'title', pc.title,
+                            'dept_code', pd.code,
+                            'course_number', pc.course_number
+                        ))
+                        FROM course_prerequisite cp
+                        JOIN course pc ON cp.prereq_course_id = pc.course_id
+                        JOIN department pd ON pc.dept_id = pd.dept_id
+                        WHERE cp.course_id = c.course_id
+                        AND NOT EXISTS (
+                            SELECT 1 
+                            FROM enrollment e
+                            JOIN section s ON e.section_id = s.section_id
+                            WHERE e.student_id = %s
+                            AND s.course_id = cp.prereq_course_id
+                            AND e.enrollment_status = 'Enrolled'
+                            AND (e.grade IS NULL OR e.grade IN ('A', 'B', 'C', 'D', 'P'))
+                        )
+                    ) as missing_prerequisites,
+                    (
+                        SELECT JSON_OBJECT(
+                            'conflicting_course', cc.title,
+                            'conflicting_section', cs.section_number,
+                            'day_of_week', ss1.day_of_week,
+                            'start_time', CAST(ss1.start_time AS CHAR),
+                            'end_time', CAST(ss1.end_time AS CHAR)
+                        )
+                        FROM enrollment e
+                        JOIN section_conflict sc ON sc.section_a = e.section_id
+                            AND sc.section_b = %s
+                        JOIN section cs ON e.section_id = cs.section_id
+                        JOIN course cc ON cs.course_id = cc.course_id
+                        JOIN section_schedule ss1 ON ss1.section_id = e.section_id
+                        JOIN section_schedule ss2 ON ss2.section_id = sc.section_b
+                            AND ss2.day_of_week = ss1.day_of_week
+                            AND ss2.start_time < ss1.end_time
+                            AND ss2.end_time > ss1.start_time
+                        WHERE e.student_id = %s 
+                        AND e.enrollment_status = 'Enrolled'
+                        LIMIT 1
+                    ) as conflict,
+                    COALESCE((
+                        SELECT stc.total_credits
+                        FROM student_term_credits stc
+                        WHERE stc.student_id = %s AND stc.term_id = %s
+                    ), 0) as current_credits
+                FROM course c
+                WHERE c.course_id = %s
             """
-            missing = execute_query(query, (course_id, student_id))
+            result = execute_query(
+                query,
+                (student_id, section_id, student_id, student_id, term_id, course_id),
+                fetch_one=True
+            )
             
-            if missing:
+            if not result:
                 return {
-                    'has_prerequisites': True,
-                    'prerequisites_met': False,
-                    'missing_prerequisites': missing
+                    'course_found': False,
+                    'course_credits': 0.0,
+                    'missing_prerequisites': [],
+                    'conflict': None,
+                    'current_credits': 0.0
                 }
             
-            # Check if course has any prerequisites
-            prereq_check = execute_query(
-                "SELECT COUNT(*) as count FROM course_prerequisite WHERE course_id = %s",
-                (course_id,),
-                fetch_one=True
-            )
-            
             return {
-                'has_prerequisites': prereq_check['count'] > 0,
-                'prerequisites_met': True,
-                'missing_prerequisites': []
+                'course_found': True,
+                'course_credits': float(result['course_credits'] or 0),
+                'missing_prerequisites': orjson.loads(result['missing_prerequisites'] or '[]'),
+                'conflict': orjson.loads(result['conflict']) if result['conflict'] else None,
+                'current_credits': float(result['current_credits'])
             }
             
         except Exception as e:
-            logger.error(f"Error checking prerequisites: {e}")
+            logger.error(f"Error validating enrollment: {e}")
             return None
-    
-    @staticmethod
-    def get_student_credit_hours(student_id, term_id):
-        """
-        Get total credit hours for a student in a term
-        
-        Args:
-            student_id (int): Student profile ID
-            term_id (int): Term ID
-            
-        Returns:
-            float: Total credit hours
-        """
-        try:
-            query = """
-                SELECT COALESCE(SUM(c.credits), 0) as total_credits
-                FROM enrollment e
-                JOIN section s ON e.section_id = s.section_id
-                JOIN course c ON s.course_id = c.course_id
-                WHERE e.student_id = %s 
-                AND s.term_id = %s
-                AND e.enrollment_status = 'Enrolled'
-            """
-            result = execute_query(query, (student_id, term_id), fetch_one=True)
-            return float(result['total_credits']) if result else 0.0
-            
-        except Exception as e:
-            logger.error(f"Error getting credit hours: {e}")
-            return 0.0
 
 
 class WaitlistModel:
@@ -345,6 +351,9 @@ class WaitlistModel:
         """
         Add student to section waitlist
         
+        Retried once when a concurrent add wins the race for the position
+        (duplicate key) or the transaction is picked as a deadlock victim.
+        
         Args:
             student_id (int): Student profile ID
             section_id (int): Section ID
@@ -352,47 +361,67 @@ class WaitlistModel:
         Returns:
             dict: Waitlist entry or None
         """
-        try:
-            with get_db_cursor() as (conn, cursor):
-                # Check if already on waitlist
-                cursor.execute("""
-                    SELECT waitlist_id 
-                    FROM waitlist 
-                    WHERE student_id = %s AND section_id = %s AND status = 'Active'
-                """, (student_id, section_id))
-                
-                if cursor.fetchone():
-                    return {'error': 'Already on waitlist', 'code': 'ALREADY_ON_WAITLIST'}
-                
-                # Get current waitlist position
-                cursor.execute("""
-                    SELECT COUNT(*) as position 
-                    FROM waitlist 
-                    WHERE section_id = %s AND status = 'Active'
-                """, (section_id,))
-                
-                position = cursor.fetchone()['position'] + 1
-                
-                # Insert waitlist entry
-                cursor.execute("""
-                    INSERT INTO waitlist (student_id, section_id, position, status)
-                    VALUES (%s, %s, %s, 'Active')
-                """, (student_id, section_id, position))
-                
-                waitlist_id = cursor.lastrowid
-                
-                logger.info(f"Student {student_id} added to waitlist for section {section_id} at position {position}")
-                
-                return {
-                    'waitlist_id': waitlist_id,
-                    'position': position,
-                    'status': 'Active'
-                }
-                
-        except Exception as e:
-            logger.error(f"Error adding to waitlist: {e}")
+        for attempt in range(2):
+            try:
+                return WaitlistModel._insert_waitlist_entry(student_id, section_id)
+            except Error as e:
+                if attempt == 0 and e.errno in _WAITLIST_RETRY_ERRNOS:
+                    logger.warning(f"Retrying waitlist add for student {student_id}: {e}")
+                    continue
+                logger.error(f"Error adding to waitlist: {e}")
+            except Exception as e:
+                logger.error(f"Error adding to waitlist: {e}")
             return {'error': 'Failed to add to waitlist', 'code': 'WAITLIST_FAILED'}
     
+    @staticmethod
+    def _insert_waitlist_entry(student_id, section_id):
+        """One add_to_waitlist transaction; database errors propagate"""
+        with get_db_cursor() as (conn, cursor):
+            # Locking the section row serializes adds per section until this
+            # transaction commits, as in enroll_student. Locking the
+            # waitlist rows instead takes gap locks that deadlock
+            # concurrent adds.
+            cursor.execute(
+                "SELECT section_id FROM section WHERE section_id = %s FOR UPDATE",
+                (section_id,)
+            )
+            
+            if not cursor.fetchone():
+                return {'error': 'Section not found', 'code': 'SECTION_NOT_FOUND'}
+            
+            # Next position and the existing-entry check in the INSERT
+            # itself; no row is inserted when the student is already
+            # waiting. Positions are never reused, as in the
+            # before_waitlist_insert trigger. The statement must not read
+            # section: the waitlist triggers update section.waitlist_count
+            # (MySQL error 1442).
+            cursor.execute("""
+                INSERT INTO waitlist (student_id, section_id, position, status)
+                SELECT %s, %s, COALESCE(MAX(position), 0) + 1, 'Active'
+                FROM waitlist
+                WHERE section_id = %s
+                HAVING COALESCE(MAX(student_id = %s AND status = 'Active'), 0) = 0
+            """, (student_id, section_id, section_id, student_id))
+            
+            if cursor.rowcount == 0:
+                return {'error': 'Already on waitlist', 'code': 'ALREADY_ON_WAITLIST'}
+            
+            waitlist_id = cursor.lastrowid
+            
+            cursor.execute(
+                "SELECT position FROM waitlist WHERE waitlist_id = %s",
+                (waitlist_id,)
+            )
+            position = cursor.fetchone()['position']
+        
+        logger.info(f"Student {student_id} added to waitlist for section {section_id} at position {position}")
+        
+        return {
+            'waitlist_id': waitlist_id,
+            'position': position,
+            'status': 'Active'
+        }
+    
     @staticmethod
     def get_student_waitlists(student_id):
         """
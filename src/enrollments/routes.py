@@ -3,12 +3,13 @@ OCRS Backend - Enrollment Routes
 API endpoints for enrollment management
 """
 
+import orjson
 from flask import Blueprint, request
 from flask_jwt_extended import get_jwt_identity
 from src.enrollments.models import EnrollmentModel, WaitlistModel
 from src.enrollments.utils import format_enrollment_response, validate_enrollment
-from src.courses.models import CourseModel
 from src.auth.decorators import require_auth, require_role
+from src.utils.database import execute_query
 from src.utils.responses import (
     success_response, error_response, created_response,
     not_found_response, forbidden_response
@@ -23,8 +24,6 @@ enrollments_bp = Blueprint('enrollments', __name__)
 
 def get_student_id_from_user(user_id):
     """Get student profile ID from user ID"""
-    from src.utils.database import execute_query
-    
     result = execute_query(
         "SELECT student_id FROM student_profile WHERE user_id = %s",
         (user_id,),
@@ -81,15 +80,11 @@ def enroll_in_section():
             return error_response("section_id is required", 400)
         
         # Get section details to find course and term
-        from src.utils.database import execute_query
         section = execute_query(
             """SELECT s.section_id, s.course_id, s.term_id, s.status, s.capacity,
-               COALESCE(COUNT(e.enrollment_id), 0) as enrolled_count
+               s.enrolled_count
                FROM section s
-               LEFT JOIN enrollment e ON s.section_id = e.section_id 
-                   AND e.enrollment_status = 'Enrolled'
-               WHERE s.section_id = %s
-               GROUP BY s.section_id, s.course_id, s.term_id, s.status, s.capacity""",
+               WHERE s.section_id = %s""",
             (section_id,),
             fetch_one=True
         )
@@ -229,28 +224,23 @@ def get_my_enrollments():
         term_id = request.args.get('term_id', type=int)
         status_filter = request.args.get('status')
         
-        # Get enrollments
-        enrollments = EnrollmentModel.get_student_enrollments(student_id, term_id=term_id)
+        # Get enrollments, already formatted as JSON by the database
+        enrollments = EnrollmentModel.get_student_enrollment_payloads(student_id, term_id=term_id)
         
         # Filter by status if provided
         if status_filter:
-            enrollments = [e for e in enrollments if e.get('enrollment_status') == status_filter]
-        
-        # Format response
-        formatted_enrollments = [format_enrollment_response(e) for e in enrollments]
+            enrollments = [e for e in enrollments if e['enrollment_status'] == status_filter]
         
         # Calculate total credits for enrolled courses
-        total_credits = sum(
-            e['course']['credits'] 
-            for e in formatted_enrollments 
-            if e['status'] == 'Enrolled'
-        )
+        enrolled = [e for e in enrollments if e['enrollment_status'] == 'Enrolled']
+        total_credits = sum(float(e['credits'] or 0) for e in enrolled)
         
         return success_response(
             data={
-                'enrollments': formatted_enrollments,
+                # Embedded as-is; the payloads are never parsed in Python
+                'enrollments': [orjson.Fragment(e['payload']) for e in enrollments],
                 'total_credits': total_credits,
-                'enrollment_count': len([e for e in formatted_enrollments if e['status'] == 'Enrolled'])
+                'enrollment_count': len(enrolled)
             }
         )
         
@@ -290,8 +280,6 @@ def get_my_schedule():
         term_id = request.args.get('term_id', type=int)
         
         # Get enrollments with schedule details
-        from src.utils.database import execute_query
-        
         query = """
             SELECT 
                 e.enrollment_id,
@@ -503,7 +491,6 @@ def validate_enrollment_request():
             return error_response("section_id is required", 400)
         
         # Get section details
-        from src.utils.database import execute_query
         section = execute_query(
             "SELECT course_id, term_id FROM section WHERE section_id = %s",
             (section_id,),
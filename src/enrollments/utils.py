@@ -60,19 +60,30 @@ def validate_enrollment(student_id, section_id, course_id, term_id):
     Returns:
         tuple: (is_valid, error_message)
     """
+    # Prerequisites, schedule conflicts and credit hours in one round-trip
+    checks = EnrollmentModel.validate_enrollment_bulk(
+        student_id, section_id, course_id, term_id
+    )
+    if checks is None:
+        return False, {'error': 'Failed to validate enrollment', 'code': 'VALIDATION_FAILED'}
+    
+    if not checks['course_found']:
+        return False, {'error': 'Course not found', 'code': 'COURSE_NOT_FOUND'}
+    
     # Check prerequisites
-    prereq_result = EnrollmentModel.check_prerequisites(student_id, course_id)
-    if prereq_result and not prereq_result.get('prerequisites_met'):
-        missing = prereq_result.get('missing_prerequisites', [])
-        missing_courses = [p['course_code'] for p in missing]
+    missing = checks['missing_prerequisites']
+    if missing:
+        missing.sort(key=lambda p: (p['dept_code'], p['course_number']))
         return False, {
             'error': 'Prerequisites not met',
             'code': 'PREREQUISITES_NOT_MET',
-            'missing_prerequisites': missing_courses
+            'missing_prerequisites': [
+                f"{p['dept_code']} {p['course_number']}" for p in missing
+            ]
         }
     
     # Check schedule conflicts
-    conflict = EnrollmentModel.check_schedule_conflict(student_id, section_id)
+    conflict = checks['conflict']
     if conflict:
         return False, {
             'error': 'Schedule conflict detected',
@@ -83,21 +94,16 @@ def validate_enrollment(student_id, section_id, course_id, term_id):
         }
     
     # Check credit hour limit (18 credits max)
-    current_credits = EnrollmentModel.get_student_credit_hours(student_id, term_id)
-    
-    # Get course credits
-    from src.courses.models import CourseModel
-    course = CourseModel.get_course_by_id(course_id)
-    if not course:
-        return False, {'error': 'Course not found', 'code': 'COURSE_NOT_FOUND'}
+    current_credits = checks['current_credits']
+    course_credits = checks['course_credits']
     
-    new_total = current_credits + float(course.get('credits', 0))
+    new_total = current_credits + course_credits
     if new_total > 18:
         return False, {
             'error': 'Credit hour limit exceeded',
             'code': 'CREDIT_LIMIT_EXCEEDED',
             'current_credits': current_credits,
-            'course_credits': float(course.get('credits', 0)),
+            'course_credits': course_credits,
             'max_credits': 18
         }
     
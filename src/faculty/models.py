@@ -3,11 +3,64 @@ OCRS Backend - Faculty Models
 Database operations for faculty functions
 """
 
-from src.utils.database import execute_query, execute_update, get_db_cursor
+from src.utils.cache import VersionedTTLCache
+from src.utils.database import execute_prepared, execute_query, execute_update, get_db_cursor
 from src.utils.logger import setup_logger
 
 logger = setup_logger('ocrs.faculty.models')
 
+VALID_GRADES = ('A', 'B', 'C', 'D', 'F', 'P', 'NP', 'W', 'I')
+
+# Largest batch update_grades_bulk accepts; bounds the IN list and CASE
+# expression of its statements
+MAX_GRADES_PER_REQUEST = 200
+
+# faculty_id per user_id; a profile's ids never change, and users without a
+# profile are not cached so a newly created profile is found at once
+faculty_id_cache = VersionedTTLCache(maxsize=4096, ttl=3600)
+
+# The inverse: user_id per faculty_id, matched against section.instructor_id
+instructor_id_cache = VersionedTTLCache(maxsize=4096, ttl=3600)
+
+_TEACHES_SECTION_QUERY = """
+    SELECT 1 AS teaches
+    FROM section
+    WHERE section_id = %s AND instructor_id = %s
+"""
+
+
+def _load_faculty_id(user_id):
+    """Fetch the faculty profile ID for a user, or None"""
+    try:
+        result = execute_prepared(
+            "SELECT faculty_id FROM faculty_profile WHERE user_id = %s",
+            (user_id,),
+            fetch_one=True
+        )
+        return result['faculty_id'] if result else None
+    except Exception as e:
+        logger.error(f"Error fetching faculty ID: {e}")
+        return None
+
+
+def _load_instructor_id(faculty_id):
+    """Fetch the user ID behind a faculty profile, or None"""
+    try:
+        result = execute_prepared(
+            "SELECT user_id FROM faculty_profile WHERE faculty_id = %s",
+            (faculty_id,),
+            fetch_one=True
+        )
+        return result['user_id'] if result else None
+    except Exception as e:
+        logger.error(f"Error fetching faculty user ID: {e}")
+        return None
+
+
+def _instructor_id(faculty_id):
+    """section.instructor_id value for a faculty profile, or None"""
+    return instructor_id_cache.get_or_load(faculty_id, lambda: _load_instructor_id(faculty_id))
+
 
 class FacultyModel:
     """Faculty database operations"""
@@ -15,21 +68,16 @@ class FacultyModel:
     @staticmethod
     def get_faculty_id_from_user(user_id):
         """Get faculty profile ID from user ID"""
-        try:
-            result = execute_query(
-                "SELECT faculty_id FROM faculty_profile WHERE user_id = %s",
-                (user_id,),
-                fetch_one=True
-            )
-            return result['faculty_id'] if result else None
-        except Exception as e:
-            logger.error(f"Error fetching faculty ID: {e}")
-            return None
+        return faculty_id_cache.get_or_load(user_id, lambda: _load_faculty_id(user_id))
     
     @staticmethod
     def get_faculty_sections(faculty_id, term_id=None):
         """Get all sections assigned to faculty"""
         try:
+            instructor_id = _instructor_id(faculty_id)
+            if not instructor_id:
+                return []
+            
             query = """
                 SELECT 
                     s.section_id,
@@ -46,30 +94,16 @@ class FacultyModel:
                     t.name as term_name,
                     t.year as term_year,
                     t.is_current,
-                    COALESCE(enrolled.count, 0) as enrolled_count,
-                    COALESCE(waitlist.count, 0) as waitlist_count
+                    s.enrolled_count,
+                    s.waitlist_count
                 FROM section s
                 JOIN course c ON s.course_id = c.course_id
                 JOIN department d ON c.dept_id = d.dept_id
                 JOIN term t ON s.term_id = t.term_id
-                LEFT JOIN (
-                    SELECT section_id, COUNT(*) as count
-                    FROM enrollment
-                    WHERE enrollment_status = 'Enrolled'
-                    GROUP BY section_id
-                ) enrolled ON s.section_id = enrolled.section_id
-                LEFT JOIN (
-                    SELECT section_id, COUNT(*) as count
-                    FROM waitlist
-                    WHERE status = 'Active'
-                    GROUP BY section_id
-                ) waitlist ON s.section_id = waitlist.section_id
-                WHERE s.instructor_id = (
-                    SELECT user_id FROM faculty_profile WHERE faculty_id = %s
-                )
+                WHERE s.instructor_id = %s
             """
             
-            params = [faculty_id]
+            params = [instructor_id]
             
             if term_id:
                 query += " AND t.term_id = %s"
@@ -90,12 +124,9 @@ class FacultyModel:
         """Get roster for a specific section"""
         try:
             # First verify faculty teaches this section
-            verify = execute_query("""
-                SELECT s.section_id 
-                FROM section s
-                JOIN faculty_profile fp ON s.instructor_id = fp.user_id
-                WHERE s.section_id = %s AND fp.faculty_id = %s
-            """, (section_id, faculty_id), fetch_one=True)
+            verify = execute_prepared(
+                _TEACHES_SECTION_QUERY, (section_id, _instructor_id(faculty_id)), fetch_one=True
+            )
             
             if not verify:
                 return None  # Faculty doesn't teach this section
@@ -120,7 +151,7 @@ class FacultyModel:
                 ORDER BY u.last_name, u.first_name
             """
             
-            return execute_query(query, (section_id,))
+            return execute_prepared(query, (section_id,))
             
         except Exception as e:
             logger.error(f"Error fetching roster: {e}")
@@ -131,20 +162,18 @@ class FacultyModel:
         """Update student grade for an enrollment"""
         try:
             # Verify faculty teaches this section
-            verify = execute_query("""
+            verify = execute_prepared("""
                 SELECT e.enrollment_id
                 FROM enrollment e
                 JOIN section s ON e.section_id = s.section_id
-                JOIN faculty_profile fp ON s.instructor_id = fp.user_id
-                WHERE e.enrollment_id = %s AND fp.faculty_id = %s
-            """, (enrollment_id, faculty_id), fetch_one=True)
+                WHERE e.enrollment_id = %s AND s.instructor_id = %s
+            """, (enrollment_id, _instructor_id(faculty_id)), fetch_one=True)
             
             if not verify:
                 return False
             
             # Validate grade
-            valid_grades = ['A', 'B', 'C', 'D', 'F', 'P', 'NP', 'W', 'I']
-            if grade not in valid_grades:
+            if grade not in VALID_GRADES:
                 return False
             
             execute_update(
@@ -159,17 +188,82 @@ class FacultyModel:
             logger.error(f"Error updating grade: {e}")
             return False
     
+    @staticmethod
+    def update_grades_bulk(faculty_id, grades):
+        """
+        Update grades for several enrollments in one transaction
+        
+        Ownership of every enrollment is verified in one query and all grades
+        are written by one UPDATE. Nothing is changed unless every grade is
+        valid and every enrollment is in a section the faculty member teaches.
+        
+        Args:
+            faculty_id (int): Faculty profile ID
+            grades (list): (enrollment_id, grade) pairs; a repeated
+                enrollment_id takes its last grade
+            
+        Returns:
+            int: Number of enrollments graded, or None if rejected
+            
+        Raises:
+            ValueError: If there are more than MAX_GRADES_PER_REQUEST grades
+        """
+        if len(grades) > MAX_GRADES_PER_REQUEST:
+            raise ValueError(
+                f"At most {MAX_GRADES_PER_REQUEST} grades can be updated at once"
+            )
+        
+        try:
+            grade_by_enrollment = dict(grades)
+            
+            if not grade_by_enrollment:
+                return 0
+            
+            if any(grade not in VALID_GRADES for grade in grade_by_enrollment.values()):
+                return None
+            
+            enrollment_ids = tuple(grade_by_enrollment)
+            placeholders = ', '.join(['%s'] * len(enrollment_ids))
+            
+            with get_db_cursor() as (conn, cursor):
+                cursor.execute(f"""
+                    SELECT e.enrollment_id
+                    FROM enrollment e
+                    JOIN section s ON e.section_id = s.section_id
+                    WHERE e.enrollment_id IN ({placeholders}) AND s.instructor_id = %s
+                """, enrollment_ids + (_instructor_id(faculty_id),))
+                
+                verified = cursor.fetchall()
+                if len(verified) != len(enrollment_ids):
+                    return None
+                
+                cases = ' '.join(['WHEN %s THEN %s'] * len(enrollment_ids))
+                params = []
+                for enrollment_id, grade in grade_by_enrollment.items():
+                    params.extend((enrollment_id, grade))
+                params.extend(enrollment_ids)
+                
+                cursor.execute(f"""
+                    UPDATE enrollment
+                    SET grade = CASE enrollment_id {cases} END
+                    WHERE enrollment_id IN ({placeholders})
+                """, tuple(params))
+            
+            logger.info(f"Faculty {faculty_id} updated {len(enrollment_ids)} grades")
+            return len(enrollment_ids)
+            
+        except Exception as e:
+            logger.error(f"Error updating grades: {e}")
+            return None
+    
     @staticmethod
     def get_section_statistics(section_id, faculty_id):
         """Get statistics for a section"""
         try:
             # Verify faculty teaches this section
-            verify = execute_query("""
-                SELECT s.section_id 
-                FROM section s
-                JOIN faculty_profile fp ON s.instructor_id = fp.user_id
-                WHERE s.section_id = %s AND fp.faculty_id = %s
-            """, (section_id, faculty_id), fetch_one=True)
+            verify = execute_prepared(
+                _TEACHES_SECTION_QUERY, (section_id, _instructor_id(faculty_id)), fetch_one=True
+            )
             
             if not verify:
                 return None
@@ -185,7 +279,7 @@ class FacultyModel:
                     COUNT(CASE WHEN e.grade = 'C' THEN 1 END) as grade_c,
                     COUNT(CASE WHEN e.grade = 'D' THEN 1 END) as grade_d,
                     COUNT(CASE WHEN e.grade = 'F' THEN 1 END) as grade_f,
-                    (SELECT COUNT(*) FROM waitlist WHERE section_id = s.section_id AND status = 'Active') as waitlist_count
+                    s.waitlist_count
                 FROM section s
                 LEFT JOIN enrollment e ON s.section_id = e.section_id
                 WHERE s.section_id = %s
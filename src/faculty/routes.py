@@ -5,7 +5,7 @@ API endpoints for faculty functions
 
 from flask import Blueprint, request
 from flask_jwt_extended import get_jwt_identity
-from src.faculty.models import FacultyModel
+from src.faculty.models import FacultyModel, MAX_GRADES_PER_REQUEST
 from src.auth.decorators import require_auth, require_role
 from src.utils.responses import success_response, error_response, not_found_response
 from src.utils.logger import setup_logger
@@ -223,6 +223,93 @@ def update_student_grade(enrollment_id):
         return error_response("An error occurred", 500)
 
 
+@faculty_bp.route('/grades', methods=['PUT'])
+@require_auth
+@require_role('faculty', 'admin')
+def update_student_grades():
+    """
+    Update grades for several enrollments at once
+    ---
+    tags:
+      - Faculty
+    security:
+      - Bearer: []
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - grades
+          properties:
+            grades:
+              type: array
+              items:
+                type: object
+                properties:
+                  enrollment_id:
+                    type: integer
+                    example: 1
+                  grade:
+                    type: string
+                    enum: [A, B, C, D, F, P, NP, W, I]
+                    example: A
+    responses:
+      200:
+        description: Grades updated successfully
+      400:
+        description: Missing or malformed grades, or more than 200 of them
+      403:
+        description: Invalid grade or not authorized to update a grade
+    """
+    try:
+        user_id = int(get_jwt_identity())
+        
+        # Get faculty profile
+        faculty_id = FacultyModel.get_faculty_id_from_user(user_id)
+        if not faculty_id:
+            return error_response("Faculty profile not found", 404)
+        
+        data = request.get_json() or {}
+        entries = data.get('grades')
+        
+        if not entries or not isinstance(entries, list):
+            return error_response("grades must be a non-empty list", 400)
+        
+        if len(entries) > MAX_GRADES_PER_REQUEST:
+            return error_response(
+                f"At most {MAX_GRADES_PER_REQUEST} grades can be updated at once",
+                400
+            )
+        
+        try:
+            grades = [
+                (int(entry['enrollment_id']), str(entry['grade']).upper())
+                for entry in entries
+            ]
+        except (KeyError, TypeError, ValueError):
+            return error_response("Each grade needs an enrollment_id and a grade", 400)
+        
+        # Update grades
+        updated = FacultyModel.update_grades_bulk(faculty_id, grades)
+        
+        if updated is None:
+            return error_response(
+                "Failed to update grades. Invalid grade or unauthorized access.",
+                403
+            )
+        
+        return success_response(
+            data={'updated': updated},
+            message="Grades updated successfully"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error updating grades: {e}")
+        return error_response("An error occurred", 500)
+
+
 @faculty_bp.route('/sections/<int:section_id>/statistics', methods=['GET'])
 @require_auth
 @require_role('faculty', 'admin')
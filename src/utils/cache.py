@@ -0,0 +1,56 @@
+"""
+OCRS Backend - Cache Utilities
+In-process caching for read-mostly data
+"""
+
+import threading
+from cachetools import TTLCache
+
+
+class VersionedTTLCache:
+    """
+    Thread-safe TTL cache with write-version invalidation
+
+    Each load records the cache version it started under and is only stored
+    if no invalidation happened in the meantime, so a slow query that began
+    before a write can never repopulate the cache with pre-write data.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.RLock()
+        self._version = 0
+
+    def get_or_load(self, key, loader):
+        """
+        Return the cached value for key, calling loader on a miss
+
+        Args:
+            key: Hashable cache key
+            loader (callable): Zero-argument function producing the value
+
+        Returns:
+            Cached or freshly loaded value. Falsy values (empty lists, None)
+            are returned but not stored, so failed lookups are retried.
+        """
+        with self._lock:
+            version = self._version
+            try:
+                return self._cache[key]
+            except KeyError:
+                pass
+
+        value = loader()
+
+        if value:
+            with self._lock:
+                if version == self._version:
+                    self._cache[key] = value
+
+        return value
+
+    def invalidate(self):
+        """Drop all cached entries and reject in-flight loads"""
+        with self._lock:
+            self._version += 1
+            self._cache.clear()
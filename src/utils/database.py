@@ -4,9 +4,15 @@ Manages MySQL database connections and operations
 """
 
 import mysql.connector
-from mysql.connector import Error, pooling
+from mysql.connector import Error, errors, pooling
 from contextlib import contextmanager
+from functools import lru_cache
+from operator import methodcaller
+import glob
 import logging
+import os
+import re
+import threading
 from config.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -15,78 +21,71 @@ logger = logging.getLogger(__name__)
 config = get_config()
 
 
-class DatabaseConnection:
-    """Singleton database connection manager"""
+def _create_pool(pool_size):
+    """
+    Create the database connection pool
     
-    _instance = None
-    _connection_pool = None
+    Args:
+        pool_size (int): Number of pooled connections
+        
+    Returns:
+        pooling.MySQLConnectionPool: Connection pool
+    """
+    try:
+        pool = pooling.MySQLConnectionPool(
+            pool_name="ocrs_pool",
+            pool_size=pool_size,
+            **config.DB_CONFIG
+        )
+        logger.info(f"Database connection pool initialized with {pool_size} connections")
+        return pool
+    except Error as e:
+        logger.error(f"Error initializing database connection pool: {e}")
+        raise
+
+
+# Sized in config: DB_MAX_CONNECTIONS split across the worker processes
+_POOL_SIZE = config.DB_POOL_SIZE
+# Created on first use, so importing this module opens no connections
+_POOL = None
+_POOL_LOCK = threading.Lock()
+# MySQLConnectionPool raises as soon as it is exhausted; one slot per
+# connection makes checkout wait for a connection instead
+_POOL_SLOTS = threading.BoundedSemaphore(_POOL_SIZE)
+
+
+def _get_pool():
+    """Return the connection pool, creating it on first use"""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = _create_pool(_POOL_SIZE)
+    return _POOL
+
+
+def get_connection():
+    """
+    Get a connection from the pool
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(DatabaseConnection, cls).__new__(cls)
-            cls._instance._initialize_pool()
-        return cls._instance
+    Callers must close the connection to return it. Prefer get_db_cursor,
+    which also waits for a free connection instead of failing at once.
     
-    def _initialize_pool(self):
-        """Initialize database connection pool"""
-        try:
-            self._connection_pool = pooling.MySQLConnectionPool(
-                pool_name="ocrs_pool",
-                pool_size=10,
-                pool_reset_session=True,
-                **config.DB_CONFIG
-            )
-            logger.info("Database connection pool initialized successfully")
-        except Error as e:
-            logger.error(f"Error initializing database connection pool: {e}")
-            raise
-    
-    def get_connection(self):
-        """
-        Get a connection from the pool
-        
-        Returns:
-            mysql.connector.connection.MySQLConnection: Database connection
-        """
-        try:
-            return self._connection_pool.get_connection()
-        except Error as e:
-            logger.error(f"Error getting connection from pool: {e}")
-            raise
-    
-    @contextmanager
-    def get_cursor(self, dictionary=True, buffered=True):
-        """
-        Context manager for database cursor
-        
-        Args:
-            dictionary (bool): Return rows as dictionaries
-            buffered (bool): Buffer results
-            
-        Yields:
-            tuple: (connection, cursor)
-        """
-        connection = None
-        cursor = None
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor(dictionary=dictionary, buffered=buffered)
-            yield connection, cursor
-            connection.commit()
-        except Error as e:
-            if connection:
-                connection.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
+    Returns:
+        mysql.connector.pooling.PooledMySQLConnection: Database connection
+    """
+    try:
+        return _get_pool().get_connection()
+    except Error as e:
+        logger.error(f"Error getting connection from pool: {e}")
+        raise
 
 
-# Global database instance
-db = DatabaseConnection()
+def _acquire_slot():
+    """Wait for a free pooled connection, up to DB_POOL_TIMEOUT seconds"""
+    if not _POOL_SLOTS.acquire(timeout=config.DB_POOL_TIMEOUT):
+        logger.error("Timed out waiting for a database connection")
+        raise errors.PoolError("Timed out waiting for a pooled connection")
 
 
 @contextmanager
@@ -94,6 +93,9 @@ def get_db_cursor(dictionary=True, buffered=True):
     """
     Convenient context manager for database operations
     
+    Runs the block in a transaction, committed when the block exits normally
+    and rolled back when it raises.
+    
     Args:
         dictionary (bool): Return rows as dictionaries
         buffered (bool): Buffer results
@@ -106,11 +108,145 @@ def get_db_cursor(dictionary=True, buffered=True):
             cursor.execute("SELECT * FROM users")
             results = cursor.fetchall()
     """
-    with db.get_cursor(dictionary=dictionary, buffered=buffered) as (conn, cursor):
-        yield conn, cursor
+    _acquire_slot()
+    
+    connection = None
+    cursor = None
+    try:
+        connection = get_connection()
+        connection.start_transaction()
+        cursor = connection.cursor(dictionary=dictionary, buffered=buffered)
+        yield connection, cursor
+        connection.commit()
+    except Error as e:
+        if connection:
+            connection.rollback()
+        logger.error(f"Database error: {e}")
+        raise
+    except Exception:
+        # Never hand the pool a connection with an open transaction
+        if connection:
+            connection.rollback()
+        raise
+    finally:
+        try:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+        finally:
+            _POOL_SLOTS.release()
 
 
-def execute_query(query, params=None, fetch_one=False, fetch_all=True):
+@contextmanager
+def get_prepared_cursor():
+    """
+    Context manager for a server-side prepared statement cursor
+    
+    The cursor prepares its statement on the first execute and deallocates
+    it when closed. Statements never outlive the checkout: the pool resets
+    the session when the connection is returned, which drops them anyway.
+    
+    Yields:
+        tuple: (connection, cursor) - call cursor.execute(query, params)
+    """
+    _acquire_slot()
+    
+    connection = None
+    cursor = None
+    try:
+        connection = get_connection()
+        cursor = connection.cursor(prepared=True, dictionary=True)
+        yield connection, cursor
+    except Error as e:
+        logger.error(f"Database error: {e}")
+        raise
+    finally:
+        try:
+            if connection:
+                if cursor and connection.unread_result:
+                    cursor.fetchall()
+                if cursor:
+                    cursor.close()
+                connection.close()
+        finally:
+            _POOL_SLOTS.release()
+
+
+def _run_statement(query, params, result):
+    """
+    Run a single autocommitted statement on a pooled connection
+    
+    The fast path behind execute_query and execute_update: no transaction
+    to open or commit, and no context manager frames around the checkout.
+    The cursor is unbuffered, so rows go straight from the socket to the
+    caller; any the result callable leaves unread are discarded.
+    
+    Args:
+        query (str): SQL query
+        params (tuple/dict): Query parameters
+        result (callable): Takes the executed cursor, returns the result
+        
+    Returns:
+        Whatever result returns
+    """
+    _acquire_slot()
+    
+    connection = None
+    cursor = None
+    try:
+        connection = get_connection()
+        cursor = connection.cursor(dictionary=True, buffered=False)
+        cursor.execute(query, params or ())
+        return result(cursor)
+    finally:
+        try:
+            if connection:
+                if cursor and connection.unread_result:
+                    cursor.fetchall()
+                if cursor:
+                    cursor.close()
+                connection.close()
+        finally:
+            _POOL_SLOTS.release()
+
+
+# A trailing LIMIT 1 is only added where it cannot change the statement
+_NO_LIMIT_ONE = re.compile(r'\bLIMIT\b|\bFOR\s+(UPDATE|SHARE)\b|\bLOCK\s+IN\b|--|#|/\*', re.I)
+
+
+@lru_cache(maxsize=1024)
+def _limit_one(query):
+    """
+    Add LIMIT 1 to a single-row SELECT so the server sends only that row
+    
+    Queries that already limit or lock rows, contain comments, or are not
+    SELECTs are returned unchanged.
+    """
+    stripped = query.strip().rstrip(';').rstrip()
+    keyword = stripped[:6].upper()
+    if keyword != 'SELECT' and not keyword.startswith('WITH'):
+        return query
+    if _NO_LIMIT_ONE.search(stripped):
+        return query
+    return stripped + ' LIMIT 1'
+
+
+_FETCH_ONE = methodcaller('fetchone')
+_FETCH_ALL = methodcaller('fetchall')
+
+
+def _no_rows(cursor):
+    """Result for statements whose rows are not wanted"""
+    return None
+
+
+def _write_result(cursor):
+    # Last inserted ID for INSERT, affected rows for UPDATE/DELETE
+    return cursor.lastrowid or cursor.rowcount
+
+
+def execute_query(query, params=None, fetch_one=False, fetch_all=True, stream=False):
     """
     Execute a SELECT query and return results
     
@@ -119,20 +255,100 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=True):
         params (tuple/dict): Query parameters
         fetch_one (bool): Fetch only one result
         fetch_all (bool): Fetch all results
+        stream (bool): Return a generator of row batches (see stream_query)
         
     Returns:
         dict/list: Query results
     """
+    if stream:
+        return stream_query(query, params)
+    
+    if fetch_one:
+        query = _limit_one(query)
+        result = _FETCH_ONE
+    elif fetch_all:
+        result = _FETCH_ALL
+    else:
+        result = _no_rows
+    
     try:
-        with get_db_cursor() as (conn, cursor):
+        return _run_statement(query, params, result)
+    except Error as e:
+        logger.error(f"Query execution error: {e}")
+        raise
+
+
+def stream_query(query, params=None, chunk=1000):
+    """
+    Execute a SELECT query and yield its rows in batches
+    
+    Rows come from an unbuffered cursor, so they are read off the socket as
+    they are consumed instead of being held in the driver and again in a
+    list. The connection stays checked out until the generator is exhausted
+    or closed.
+    
+    Args:
+        query (str): SQL query
+        params (tuple/dict): Query parameters
+        chunk (int): Rows per batch
+        
+    Yields:
+        list: Up to chunk rows
+    """
+    _acquire_slot()
+    
+    connection = None
+    cursor = None
+    try:
+        connection = get_connection()
+        cursor = connection.cursor(dictionary=True, buffered=False)
+        cursor.arraysize = chunk
+        cursor.execute(query, params or ())
+        while True:
+            rows = cursor.fetchmany(chunk)
+            if not rows:
+                break
+            yield rows
+    except Error as e:
+        logger.error(f"Query execution error: {e}")
+        raise
+    finally:
+        try:
+            if connection:
+                # Drain rows left by an early close (e.g. client
+                # disconnect) so the connection returns to the pool clean
+                if cursor and connection.unread_result:
+                    cursor.fetchall()
+                if cursor:
+                    cursor.close()
+                connection.close()
+        finally:
+            _POOL_SLOTS.release()
+
+
+def execute_prepared(query, params=None, fetch_one=False):
+    """
+    Execute a fixed SELECT query as a server-side prepared statement
+    
+    Parameters are sent typed in the binary protocol instead of being
+    spliced into the SQL text.
+    
+    Args:
+        query (str): SQL query with %s placeholders
+        params (tuple): Query parameters
+        fetch_one (bool): Fetch only one result
+        
+    Returns:
+        dict/list: Query results
+    """
+    try:
+        with get_prepared_cursor() as (conn, cursor):
             cursor.execute(query, params or ())
+            rows = cursor.fetchall()
             
             if fetch_one:
-                return cursor.fetchone()
-            elif fetch_all:
-                return cursor.fetchall()
-            else:
-                return None
+                return rows[0] if rows else None
+            return rows
     except Error as e:
         logger.error(f"Query execution error: {e}")
         raise
@@ -150,15 +366,7 @@ def execute_update(query, params=None):
         int: Number of affected rows or last inserted ID
     """
     try:
-        with get_db_cursor() as (conn, cursor):
-            cursor.execute(query, params or ())
-            
-            # Return last inserted ID for INSERT operations
-            if cursor.lastrowid:
-                return cursor.lastrowid
-            
-            # Return affected rows for UPDATE/DELETE operations
-            return cursor.rowcount
+        return _run_statement(query, params, _write_result)
     except Error as e:
         logger.error(f"Update execution error: {e}")
         raise
@@ -168,6 +376,9 @@ def execute_many(query, params_list):
     """
     Execute a query with multiple parameter sets
     
+    For INSERT ... VALUES statements the driver sends a single multi-row
+    INSERT; other statements run once per parameter set.
+    
     Args:
         query (str): SQL query
         params_list (list): List of parameter tuples/dicts
@@ -202,22 +413,97 @@ def test_connection():
         return False
 
 
+_DATABASE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'database'
+)
+SCHEMA_FILE = os.path.normpath(os.path.join(_DATABASE_DIR, 'schema.sql'))
+MIGRATIONS_DIR = os.path.normpath(os.path.join(_DATABASE_DIR, 'migrations'))
+
+# Parsed scripts by path, as (mtime, script)
+_SQL_SCRIPTS = {}
+
+
+def read_sql_script(path):
+    """
+    Read a SQL script for multi-statement execution
+    
+    DELIMITER lines are a mysql client directive the server does not
+    understand. They are dropped, and statements ending in a custom
+    delimiter (e.g. END//) are ended with a semicolon instead; the server
+    parses BEGIN ... END bodies itself.
+    
+    The result is cached until the file's mtime changes, so repeated
+    init/seed runs (e.g. in tests) do not re-read the file.
+    
+    Args:
+        path (str): Path to the .sql file
+        
+    Returns:
+        str: Script ready for cursor.execute(..., multi=True)
+    """
+    mtime = os.stat(path).st_mtime
+    cached = _SQL_SCRIPTS.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    with open(path, 'r') as f:
+        lines = f.read().splitlines()
+    
+    delimiter = ';'
+    script = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped.upper().startswith('DELIMITER '):
+            delimiter = stripped.split(None, 1)[1]
+            continue
+        if delimiter != ';' and stripped.endswith(delimiter):
+            line = line.rstrip()[:-len(delimiter)] + ';'
+        script.append(line)
+    
+    script = '\n'.join(script)
+    _SQL_SCRIPTS[path] = (mtime, script)
+    return script
+
+
+def execute_script(cursor, script):
+    """
+    Run a multi-statement SQL script in a single round-trip
+    
+    Args:
+        cursor: Database cursor
+        script (str): Statements as returned by read_sql_script
+    """
+    for result in cursor.execute(script, multi=True):
+        if result.with_rows:
+            result.fetchall()
+
+
+def schema_scripts():
+    """
+    SQL scripts that build the current schema, in the order to run them
+    
+    schema.sql creates the base tables; the migrations in database/migrations
+    then apply in filename order. Fresh installs need all of them, since the
+    application queries tables, columns and triggers only the migrations
+    create.
+    
+    Returns:
+        list: Paths to .sql files
+    """
+    migrations = sorted(glob.glob(os.path.join(MIGRATIONS_DIR, '*.sql')))
+    return [SCHEMA_FILE] + migrations
+
+
 def init_database():
     """
-    Initialize database with schema
+    Initialize database with schema and migrations
     This should be run once during setup
     """
     try:
-        # Read schema file
-        with open('database/schema.sql', 'r') as f:
-            schema_sql = f.read()
-        
-        # Execute schema
+        # Execute schema, then each migration
         with get_db_cursor() as (conn, cursor):
-            # Split by semicolons and execute each statement
-            for statement in schema_sql.split(';'):
-                if statement.strip():
-                    cursor.execute(statement)
+            for path in schema_scripts():
+                execute_script(cursor, read_sql_script(path))
         
         logger.info("Database schema initialized successfully")
         return True
@@ -231,15 +517,11 @@ def seed_database():
     Seed database with initial data
     """
     try:
-        # Read seed file
-        with open('database/seeds/initial_data.sql', 'r') as f:
-            seed_sql = f.read()
+        seed_sql = read_sql_script('database/seeds/initial_data.sql')
         
-        # Execute seed data
+        # Execute seed data as one transaction
         with get_db_cursor() as (conn, cursor):
-            for statement in seed_sql.split(';'):
-                if statement.strip():
-                    cursor.execute(statement)
+            execute_script(cursor, seed_sql)
         
         logger.info("Database seeded successfully")
         return True
@@ -250,6 +532,43 @@ def seed_database():
 
 # Utility functions for common operations
 
+# Table and column names are spliced into SQL; only plain identifiers allowed
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+
+def _check_identifiers(*names):
+    """Raise ValueError unless every name is a plain SQL identifier"""
+    for name in names:
+        if not isinstance(name, str) or not _IDENTIFIER.fullmatch(name):
+            raise ValueError(f"Invalid SQL identifier: {name!r}")
+
+
+# SQL templates for the helpers below, built once per (table, columns)
+
+@lru_cache(maxsize=512)
+def _insert_sql(table, columns, row_count=1):
+    return build_insert_sql(table, columns, row_count)
+
+
+@lru_cache(maxsize=512)
+def _update_sql(table, id_column, columns):
+    _check_identifiers(table, id_column, *columns)
+    set_clause = ', '.join([f"{k} = %s" for k in columns])
+    return f"UPDATE {table} SET {set_clause} WHERE {id_column} = %s"
+
+
+@lru_cache(maxsize=256)
+def _select_by_id_sql(table, id_column):
+    _check_identifiers(table, id_column)
+    return f"SELECT * FROM {table} WHERE {id_column} = %s LIMIT 1"
+
+
+@lru_cache(maxsize=256)
+def _delete_sql(table, id_column):
+    _check_identifiers(table, id_column)
+    return f"DELETE FROM {table} WHERE {id_column} = %s"
+
+
 def get_by_id(table, id_column, id_value):
     """
     Get a single record by ID
@@ -262,8 +581,7 @@ def get_by_id(table, id_column, id_value):
     Returns:
         dict: Record or None
     """
-    query = f"SELECT * FROM {table} WHERE {id_column} = %s"
-    return execute_query(query, (id_value,), fetch_one=True)
+    return execute_query(_select_by_id_sql(table, id_column), (id_value,), fetch_one=True)
 
 
 def get_all(table, conditions=None, order_by=None, limit=None):
@@ -293,6 +611,32 @@ def get_all(table, conditions=None, order_by=None, limit=None):
     return execute_query(query, fetch_all=True)
 
 
+def build_insert_sql(table, columns, row_count=1):
+    """
+    Build a parameterized INSERT for one or more rows
+    
+    The keyword is written as lowercase "values": some DB-API drivers only
+    take their batched executemany path when it matches that spelling.
+    
+    Args:
+        table (str): Table name
+        columns (list): Column names
+        row_count (int): Number of row tuples
+        
+    Returns:
+        str: INSERT INTO table (columns) values (%s, ...), ...
+        
+    Raises:
+        ValueError: If the table or a column is not a plain identifier
+    """
+    _check_identifiers(table, *columns)
+    row_placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) values "
+        + ', '.join([row_placeholders] * row_count)
+    )
+
+
 def insert_record(table, data):
     """
     Insert a record into a table
@@ -304,11 +648,46 @@ def insert_record(table, data):
     Returns:
         int: Inserted record ID
     """
-    columns = ', '.join(data.keys())
-    placeholders = ', '.join(['%s'] * len(data))
-    query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+    return execute_update(_insert_sql(table, tuple(data)), tuple(data.values()))
+
+
+def insert_many(table, rows, chunk_size=1000):
+    """
+    Insert many records with multi-row INSERT statements
+    
+    Rows are sent chunk_size at a time as INSERT ... values (...), (...),
+    keeping each statement well under max_allowed_packet. All chunks run
+    in one transaction.
     
-    return execute_update(query, tuple(data.values()))
+    Args:
+        table (str): Table name
+        rows (list): Column-value dicts, all with the same columns
+        chunk_size (int): Rows per INSERT statement
+        
+    Returns:
+        int: Number of inserted rows
+    """
+    if not rows:
+        return 0
+    
+    keys = tuple(rows[0])
+    key_set = set(keys)
+    if any(row.keys() != key_set for row in rows):
+        raise ValueError("All rows must have the same columns")
+    
+    inserted = 0
+    
+    try:
+        with get_db_cursor() as (conn, cursor):
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                params = tuple(row[key] for row in chunk for key in keys)
+                cursor.execute(_insert_sql(table, keys, len(chunk)), params)
+                inserted += cursor.rowcount
+        return inserted
+    except Error as e:
+        logger.error(f"Batch insert error: {e}")
+        raise
 
 
 def update_record(table, id_column, id_value, data):
@@ -324,11 +703,8 @@ def update_record(table, id_column, id_value, data):
     Returns:
         int: Number of affected rows
     """
-    set_clause = ', '.join([f"{k} = %s" for k in data.keys()])
-    query = f"UPDATE {table} SET {set_clause} WHERE {id_column} = %s"
-    
-    params = list(data.values()) + [id_value]
-    return execute_update(query, tuple(params))
+    query = _update_sql(table, id_column, tuple(data))
+    return execute_update(query, (*data.values(), id_value))
 
 
 def delete_record(table, id_column, id_value):
@@ -343,5 +719,4 @@ def delete_record(table, id_column, id_value):
     Returns:
         int: Number of affected rows
     """
-    query = f"DELETE FROM {table} WHERE {id_column} = %s"
-    return execute_update(query, (id_value,))
\ No newline at end of file
+    return execute_update(_delete_sql(table, id_column), (id_value,))
\ No newline at end of file
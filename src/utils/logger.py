@@ -23,12 +23,13 @@ def setup_logger(name=None):
         logging.Logger: Configured logger
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, config.LOG_LEVEL))
     
-    # Avoid duplicate handlers
+    # Already configured - avoid duplicate handlers and repeated setup
     if logger.handlers:
         return logger
     
+    logger.setLevel(getattr(logging, config.LOG_LEVEL))
+    
     # Create logs directory if it doesn't exist
     log_dir = os.path.dirname(config.LOG_FILE)
     if log_dir and not os.path.exists(log_dir):
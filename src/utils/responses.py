@@ -3,8 +3,61 @@ OCRS Backend - Response Utilities
 Standardized API response formatting
 """
 
-from flask import jsonify
-from datetime import datetime
+import hashlib
+import time
+import orjson
+from flask import current_app, request, stream_with_context
+from datetime import datetime, timezone
+
+# Dates are passed through to Flask's serializer so they keep jsonify's format
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+# (second, ISO string) of the last response timestamp
+_timestamp = (None, None)
+
+
+def _now_iso():
+    """
+    Current UTC time in ISO 8601, formatted at most once per second
+    
+    Envelope timestamps carry whole seconds (no fractional part, no UTC
+    offset), so every response within the same second shares one string
+    instead of formatting a new datetime.
+    
+    Returns:
+        str: e.g. '2025-11-01T12:00:00'
+    """
+    global _timestamp
+    second = int(time.time())
+    cached_second, cached = _timestamp
+    if second != cached_second:
+        cached = datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat()
+        _timestamp = (second, cached)
+    return cached
+
+
+def _json_default(value):
+    """Serialize types orjson does not handle natively the way jsonify would"""
+    return current_app.json.default(value)
+
+
+def json_response(payload, status_code=200):
+    """
+    Encode a payload with orjson into a JSON response
+    
+    Args:
+        payload: JSON-serializable response body
+        status_code (int): HTTP status code
+        
+    Returns:
+        flask.Response: JSON response
+    """
+    return current_app.response_class(
+        orjson.dumps(payload, default=_json_default, option=_ORJSON_OPTIONS),
+        status=status_code,
+        mimetype='application/json'
+    )
 
 
 def success_response(data=None, message=None, status_code=200):
@@ -21,7 +74,7 @@ def success_response(data=None, message=None, status_code=200):
     """
     response = {
         'success': True,
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': _now_iso(),
     }
     
     if message:
@@ -30,7 +83,121 @@ def success_response(data=None, message=None, status_code=200):
     if data is not None:
         response['data'] = data
     
-    return jsonify(response), status_code
+    return json_response(response), status_code
+
+
+def compute_etag(data):
+    """
+    Compute a strong ETag for response data
+    
+    Args:
+        data: JSON-serializable response data
+        
+    Returns:
+        str: Hex digest of the encoded data
+    """
+    encoded = orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def preencode(data):
+    """
+    Serialize response data once for reuse across many responses
+    
+    The returned fragment can be passed as data to success_response and is
+    embedded in the envelope without being re-serialized.
+    
+    Args:
+        data: JSON-serializable response data
+        
+    Returns:
+        tuple: (orjson.Fragment, str) - (encoded data, ETag)
+    """
+    encoded = orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+    return orjson.Fragment(encoded), hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def cached_success_response(data, etag=None, max_age=300, stale_while_revalidate=60):
+    """
+    Create a successful response that clients and proxies may cache
+    
+    The ETag covers data only, not the envelope timestamp, so unchanged data
+    keeps the same tag. A request whose If-None-Match already holds it gets
+    an empty 304 Not Modified.
+    
+    Args:
+        data: Response data
+        etag (str): Precomputed ETag for data (computed if omitted)
+        max_age (int): Seconds the response may be reused
+        stale_while_revalidate (int): Seconds a stale response may be served
+            while revalidating
+        
+    Returns:
+        tuple: (response, status_code)
+    """
+    if etag is None:
+        etag = compute_etag(data)
+    
+    if request.if_none_match.contains_weak(etag):
+        response, status_code = current_app.response_class(status=304), 304
+    else:
+        response, status_code = success_response(data=data)
+    
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = (
+        f'public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}'
+    )
+    return response, status_code
+
+
+def stream_success_response(data, list_key, items, count_key=None):
+    """
+    Create a successful response whose main list is streamed
+    
+    The envelope matches success_response, but data[list_key] is encoded
+    item by item as the iterable is consumed, so the list is never held in
+    memory. Errors raised mid-stream cannot change the status code: they
+    propagate and abort the response, so the client gets a truncated body
+    instead of a short list that looks complete. Read anything that may fail
+    early (e.g. the first batch of rows) before calling this, so those
+    failures still produce an error status.
+    
+    Args:
+        data (dict): Other response data fields
+        list_key (str): Key for the streamed list
+        items (iterable): JSON-serializable items
+        count_key (str): Optional key for the number of items written
+        
+    Returns:
+        tuple: (response, status_code)
+    """
+    def dumps(value):
+        return orjson.dumps(value, default=_json_default, option=_ORJSON_OPTIONS)
+    
+    def generate():
+        # Open the data object from its encoded fields, minus the closing brace
+        fields = dumps(data)[:-1]
+        separator = b',' if len(fields) > 1 else b''
+        yield (
+            b'{"success":true,"timestamp":' + dumps(_now_iso()) +
+            b',"data":' + fields + separator + dumps(list_key) + b':['
+        )
+        
+        count = 0
+        for item in items:
+            yield (b',' if count else b'') + dumps(item)
+            count += 1
+        
+        tail = b']'
+        if count_key:
+            tail += b',' + dumps(count_key) + b':' + dumps(count)
+        yield tail + b'}}'
+    
+    response = current_app.response_class(
+        stream_with_context(generate()),
+        mimetype='application/json'
+    )
+    return response, 200
 
 
 def error_response(message, status_code=400, errors=None):
@@ -47,7 +214,7 @@ def error_response(message, status_code=400, errors=None):
     """
     response = {
         'success': False,
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': _now_iso(),
         'error': {
             'message': message,
             'code': status_code
@@ -57,7 +224,7 @@ def error_response(message, status_code=400, errors=None):
     if errors:
         response['error']['details'] = errors
     
-    return jsonify(response), status_code
+    return json_response(response), status_code
 
 
 def validation_error_response(errors):
@@ -184,18 +351,20 @@ def paginated_response(items, page, per_page, total):
     Returns:
         tuple: (response, status_code)
     """
-    total_pages = (total + per_page - 1) // per_page
-    
-    data = {
-        'items': items,
-        'pagination': {
-            'page': page,
-            'per_page': per_page,
-            'total_items': total,
-            'total_pages': total_pages,
-            'has_next': page < total_pages,
-            'has_prev': page > 1
-        }
-    }
+    total_pages = -(-total // per_page)
     
-    return success_response(data=data)
\ No newline at end of file
+    return json_response({
+        'success': True,
+        'timestamp': _now_iso(),
+        'data': {
+            'items': items,
+            'pagination': {
+                'page': page,
+                'per_page': per_page,
+                'total_items': total,
+                'total_pages': total_pages,
+                'has_next': page < total_pages,
+                'has_prev': page > 1
+            }
+        }
+    }), 200
@@ -4,11 +4,45 @@ Input validation and sanitization functions
 """
 
 import re
+from functools import wraps
+from flask import request
 from email_validator import validate_email, EmailNotValidError
 from config.config import get_config
+from src.utils.responses import error_response
 
 config = get_config()
 
+# Password policy, read once from config
+_PASSWORD_MIN_LENGTH = config.PASSWORD_MIN_LENGTH
+_PASSWORD_REQUIRE_UPPERCASE = config.PASSWORD_REQUIRE_UPPERCASE
+_PASSWORD_REQUIRE_LOWERCASE = config.PASSWORD_REQUIRE_LOWERCASE
+_PASSWORD_REQUIRE_DIGITS = config.PASSWORD_REQUIRE_DIGITS
+_PASSWORD_REQUIRE_SPECIAL = config.PASSWORD_REQUIRE_SPECIAL
+
+# Syntax-only email checks unless DNS deliverability is switched on
+_CHECK_DELIVERABILITY = config.VALIDATE_EMAIL_DELIVERABILITY
+
+# Character class bit per byte value, so a password is classified by one
+# bytes.translate pass instead of a regex search per class
+_UPPER, _LOWER, _DIGIT, _SPECIAL = 1, 2, 4, 8
+_CHAR_CLASSES = bytearray(256)
+for _chars, _bit in (
+    (b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', _UPPER),
+    (b'abcdefghijklmnopqrstuvwxyz', _LOWER),
+    (b'0123456789', _DIGIT),
+    (b'!@#$%^&*(),.?":{}|<>', _SPECIAL),
+):
+    for _byte in _chars:
+        _CHAR_CLASSES[_byte] = _bit
+_CHAR_CLASSES = bytes(_CHAR_CLASSES)
+del _chars, _bit, _byte
+_RE_NAME = re.compile(r"^[a-zA-Z\s'-]+$")
+_RE_TIME = re.compile(r'^([01]\d|2[0-3]):([0-5]\d):([0-5]\d)$')
+
+_DAYS_OF_WEEK = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_VALID_DAYS = frozenset(_DAYS_OF_WEEK)
+_INVALID_DAY_MESSAGE = f"Invalid day of week (must be one of: {', '.join(_DAYS_OF_WEEK)})"
+
 
 class ValidationError(Exception):
     """Custom validation error"""
@@ -28,19 +62,25 @@ def validate_password(password):
     if not password:
         return False, "Password is required"
     
-    if len(password) < config.PASSWORD_MIN_LENGTH:
-        return False, f"Password must be at least {config.PASSWORD_MIN_LENGTH} characters"
+    if len(password) < _PASSWORD_MIN_LENGTH:
+        return False, f"Password must be at least {_PASSWORD_MIN_LENGTH} characters"
+    
+    # Map every byte to its class bit and OR together the distinct bits;
+    # non-ASCII characters belong to no class
+    found = 0
+    for bit in set(password.encode('utf-8', 'ignore').translate(_CHAR_CLASSES)):
+        found |= bit
     
-    if config.PASSWORD_REQUIRE_UPPERCASE and not re.search(r'[A-Z]', password):
+    if _PASSWORD_REQUIRE_UPPERCASE and not found & _UPPER:
         return False, "Password must contain at least one uppercase letter"
     
-    if config.PASSWORD_REQUIRE_LOWERCASE and not re.search(r'[a-z]', password):
+    if _PASSWORD_REQUIRE_LOWERCASE and not found & _LOWER:
         return False, "Password must contain at least one lowercase letter"
     
-    if config.PASSWORD_REQUIRE_DIGITS and not re.search(r'\d', password):
+    if _PASSWORD_REQUIRE_DIGITS and not found & _DIGIT:
         return False, "Password must contain at least one digit"
     
-    if config.PASSWORD_REQUIRE_SPECIAL and not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if _PASSWORD_REQUIRE_SPECIAL and not found & _SPECIAL:
         return False, "Password must contain at least one special character"
     
     return True, ""
@@ -61,7 +101,7 @@ def validate_email_address(email):
     
     try:
         # Validate and normalize email
-        valid = validate_email(email)
+        valid = validate_email(email, check_deliverability=_CHECK_DELIVERABILITY)
         return True, valid.email
     except EmailNotValidError as e:
         return False, str(e)
@@ -87,8 +127,10 @@ def validate_name(name, field_name="Name"):
     if len(name) > 80:
         return False, f"{field_name} must not exceed 80 characters"
     
-    # Allow letters, spaces, hyphens, and apostrophes
-    if not re.match(r"^[a-zA-Z\s'-]+$", name):
+    # Allow letters, spaces, hyphens, and apostrophes; plain ASCII names
+    # pass the str checks, anything else (e.g. tabs) goes to the regex
+    letters = name.replace(' ', '').replace('-', '').replace("'", '')
+    if not (letters.isascii() and letters.isalpha()) and not _RE_NAME.match(name):
         return False, f"{field_name} contains invalid characters"
     
     return True, ""
@@ -108,7 +150,12 @@ def validate_student_number(student_number):
         return False, "Student number is required"
     
     # Format: S followed by 7 digits (e.g., S2025001)
-    if not re.match(r'^S\d{7}$', student_number):
+    if not (
+        len(student_number) == 8
+        and student_number[0] == 'S'
+        and student_number.isascii()
+        and student_number[1:].isdigit()
+    ):
         return False, "Invalid student number format (must be S followed by 7 digits)"
     
     return True, ""
@@ -128,7 +175,11 @@ def validate_course_number(course_number):
         return False, "Course number is required"
     
     # Format: 3-4 digits
-    if not re.match(r'^\d{3,4}$', course_number):
+    if not (
+        3 <= len(course_number) <= 4
+        and course_number.isascii()
+        and course_number.isdigit()
+    ):
         return False, "Invalid course number format (must be 3-4 digits)"
     
     return True, ""
@@ -176,7 +227,11 @@ def validate_section_number(section_number):
         return False, "Section number is required"
     
     # Format: 4 digits (e.g., 0101)
-    if not re.match(r'^\d{4}$', section_number):
+    if not (
+        len(section_number) == 4
+        and section_number.isascii()
+        and section_number.isdigit()
+    ):
         return False, "Invalid section number format (must be 4 digits)"
     
     return True, ""
@@ -240,7 +295,7 @@ def validate_time(time_str):
     if not time_str:
         return False, "Time is required"
     
-    if not re.match(r'^([01]\d|2[0-3]):([0-5]\d):([0-5]\d)$', time_str):
+    if not _RE_TIME.match(time_str):
         return False, "Invalid time format (must be HH:MM:SS)"
     
     return True, ""
@@ -256,10 +311,8 @@ def validate_day_of_week(day):
     Returns:
         tuple: (bool, str) - (is_valid, error_message)
     """
-    valid_days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    
-    if day not in valid_days:
-        return False, f"Invalid day of week (must be one of: {', '.join(valid_days)})"
+    if day not in _VALID_DAYS:
+        return False, _INVALID_DAY_MESSAGE
     
     return True, ""
 
@@ -299,7 +352,11 @@ def validate_required_fields(data, required_fields):
     Returns:
         tuple: (bool, list) - (is_valid, missing_fields)
     """
-    missing_fields = [field for field in required_fields if field not in data or not data[field]]
+    # Common case: every field present and non-empty, one lookup each
+    if all(map(data.get, required_fields)):
+        return True, []
+    
+    missing_fields = [field for field in required_fields if not data.get(field)]
     
     return len(missing_fields) == 0, missing_fields
 
@@ -308,15 +365,47 @@ def validate_enum(value, valid_values, field_name="Value"):
     """
     Validate that value is in list of valid values
     
+    Pass a module-level frozenset for hashed membership; a list is scanned.
+    
     Args:
         value: Value to validate
-        valid_values (list): List of valid values
+        valid_values (frozenset/tuple/list): Valid values
         field_name (str): Field name for error messages
         
     Returns:
         tuple: (bool, str) - (is_valid, error_message)
     """
     if value not in valid_values:
-        return False, f"{field_name} must be one of: {', '.join(map(str, valid_values))}"
+        choices = map(str, valid_values)
+        if isinstance(valid_values, (set, frozenset)):
+            # Sets have no order of their own; keep the message stable
+            choices = sorted(choices)
+        return False, f"{field_name} must be one of: {', '.join(choices)}"
+    
+    return True, ""
+
+
+def validate_query(parser):
+    """
+    Decorator that parses query parameters before the route runs
+    
+    Invalid input is rejected with a 400 before the route body executes;
+    valid input is passed to the route as the `params` keyword argument.
     
-    return True, ""
\ No newline at end of file
+    Args:
+        parser (callable): Takes request.args, returns (params, error_message)
+    
+    Usage:
+        @validate_query(SearchParams.from_args)
+        def search_courses(params):
+            ...
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            params, error = parser(request.args)
+            if error:
+                return error_response(error, 400)
+            return fn(*args, params=params, **kwargs)
+        return wrapper
+    return decorator
@@ -5,17 +5,18 @@ Test configuration and fixtures
 import pytest
 import sys
 import os
+import uuid
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.app import create_app
-from src.utils.database import DatabaseConnection
+from src.utils.database import execute_query, execute_update
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def app():
-    """Create application for testing"""
+    """Create application for testing, once per test session"""
     app = create_app('testing')
     return app
 
@@ -26,10 +27,10 @@ def client(app):
     return app.test_client()
 
 
-@pytest.fixture
-def admin_token(client):
-    """Get admin authentication token"""
-    response = client.post('/api/auth/login', json={
+@pytest.fixture(scope='session')
+def admin_token(app):
+    """Get admin authentication token, once per test session"""
+    response = app.test_client().post('/api/auth/login', json={
         'email': 'admin@umgc.edu',
         'password': 'Password123!'
     })
@@ -37,10 +38,10 @@ def admin_token(client):
     return data['data']['access_token']
 
 
-@pytest.fixture
-def student_token(client):
-    """Get student authentication token"""
-    response = client.post('/api/auth/login', json={
+@pytest.fixture(scope='session')
+def student_token(app):
+    """Get student authentication token, once per test session"""
+    response = app.test_client().post('/api/auth/login', json={
         'email': 'maurice.a@student.umgc.edu',
         'password': 'Password123!'
     })
@@ -48,12 +49,56 @@ def student_token(client):
     return data['data']['access_token']
 
 
-@pytest.fixture
-def faculty_token(client):
-    """Get faculty authentication token"""
-    response = client.post('/api/auth/login', json={
+@pytest.fixture(scope='session')
+def faculty_token(app):
+    """Get faculty authentication token, once per test session"""
+    response = app.test_client().post('/api/auth/login', json={
         'email': 'j.smith@umgc.edu',
         'password': 'Password123!'
     })
     data = response.get_json()
-    return data['data']['access_token']
\ No newline at end of file
+    return data['data']['access_token']
+
+
+@pytest.fixture
+def make_section():
+    """
+    Factory for throwaway sections, removed with their enrollments afterwards
+    
+    Each call creates a one-credit course with a single section in the
+    current term. The section has no meetings and the course no
+    prerequisites, so any student can enroll in it.
+    """
+    section_ids = []
+    course_ids = []
+    
+    def make(instructor_email='j.smith@umgc.edu'):
+        dept = execute_query("SELECT dept_id FROM department WHERE code = 'CMSC'", fetch_one=True)
+        term = execute_query("SELECT term_id FROM term WHERE is_current = 1", fetch_one=True)
+        # Faculty routes match section.instructor_id against the user ID
+        instructor = execute_query(
+            "SELECT user_id FROM user_account WHERE email = %s", (instructor_email,), fetch_one=True
+        )
+        
+        course_id = execute_update(
+            "INSERT INTO course (dept_id, course_number, title, credits) VALUES (%s, %s, %s, 1)",
+            (dept['dept_id'], f"T{uuid.uuid4().hex[:8]}", 'Test Course')
+        )
+        course_ids.append(course_id)
+        
+        section_id = execute_update(
+            "INSERT INTO section (course_id, term_id, section_number, instructor_id, capacity) "
+            "VALUES (%s, %s, '0101', %s, 10)",
+            (course_id, term['term_id'], instructor['user_id'])
+        )
+        section_ids.append(section_id)
+        return section_id
+    
+    yield make
+    
+    # Delete enrollments explicitly: cascaded deletes skip the triggers that
+    # keep student_term_credits in step
+    for section_id in section_ids:
+        execute_update("DELETE FROM enrollment WHERE section_id = %s", (section_id,))
+    for course_id in course_ids:
+        execute_update("DELETE FROM course WHERE course_id = %s", (course_id,))
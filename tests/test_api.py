@@ -3,6 +3,29 @@ API endpoint tests
 """
 
 import pytest
+from src.faculty.models import MAX_GRADES_PER_REQUEST
+from src.utils.database import execute_query, execute_update
+
+
+def _enroll(email, section_id):
+    """Enroll a seeded student directly in the database, returning the enrollment ID"""
+    student = execute_query(
+        "SELECT sp.student_id FROM student_profile sp "
+        "JOIN user_account u ON sp.user_id = u.user_id WHERE u.email = %s",
+        (email,), fetch_one=True
+    )
+    return execute_update(
+        "INSERT INTO enrollment (student_id, section_id) VALUES (%s, %s)",
+        (student['student_id'], section_id)
+    )
+
+
+def _grade(enrollment_id):
+    """Current grade of an enrollment"""
+    row = execute_query(
+        "SELECT grade FROM enrollment WHERE enrollment_id = %s", (enrollment_id,), fetch_one=True
+    )
+    return row['grade']
 
 
 class TestHealthEndpoints:
@@ -124,6 +147,18 @@ class TestEnrollmentEndpoints:
         data = response.get_json()
         assert data['success'] is True
     
+    def test_enroll_updates_section_count(self, client, student_token, make_section):
+        """Test enrolling goes through the enrollment triggers"""
+        section_id = make_section()
+        count_query = "SELECT enrolled_count FROM section WHERE section_id = %s"
+        assert execute_query(count_query, (section_id,), fetch_one=True)['enrolled_count'] == 0
+        
+        response = client.post('/api/enrollments/enroll', json={'section_id': section_id}, headers={
+            'Authorization': f'Bearer {student_token}'
+        })
+        assert response.status_code == 201
+        assert execute_query(count_query, (section_id,), fetch_one=True)['enrolled_count'] == 1
+    
     def test_unauthorized_enrollment_access(self, client):
         """Test enrollment endpoint without token"""
         response = client.get('/api/enrollments/my-enrollments')
@@ -163,6 +198,64 @@ class TestFacultyEndpoints:
         assert data['success'] is True
         assert 'sections' in data['data']
     
+    def test_update_grades_bulk(self, client, faculty_token, make_section):
+        """Test grading several enrollments in one request"""
+        section_id = make_section()
+        first = _enroll('maurice.a@student.umgc.edu', section_id)
+        second = _enroll('mansour.c@student.umgc.edu', section_id)
+        
+        response = client.put('/api/faculty/grades', json={'grades': [
+            {'enrollment_id': first, 'grade': 'a'},
+            {'enrollment_id': second, 'grade': 'B'}
+        ]}, headers={
+            'Authorization': f'Bearer {faculty_token}'
+        })
+        assert response.status_code == 200
+        assert response.get_json()['data']['updated'] == 2
+        assert _grade(first) == 'A'
+        assert _grade(second) == 'B'
+    
+    def test_update_grades_bulk_rejects_other_sections(self, client, faculty_token, make_section):
+        """Test that one enrollment outside the faculty's sections rejects the batch"""
+        own = _enroll('maurice.a@student.umgc.edu', make_section())
+        other = _enroll('maurice.a@student.umgc.edu', make_section('e.johnson@umgc.edu'))
+        
+        response = client.put('/api/faculty/grades', json={'grades': [
+            {'enrollment_id': own, 'grade': 'A'},
+            {'enrollment_id': other, 'grade': 'A'}
+        ]}, headers={
+            'Authorization': f'Bearer {faculty_token}'
+        })
+        assert response.status_code == 403
+        assert _grade(own) is None
+        assert _grade(other) is None
+    
+    def test_update_grades_bulk_rejects_invalid_grade(self, client, faculty_token, make_section):
+        """Test that an invalid grade rejects the batch"""
+        section_id = make_section()
+        valid = _enroll('maurice.a@student.umgc.edu', section_id)
+        invalid = _enroll('mansour.c@student.umgc.edu', section_id)
+        
+        response = client.put('/api/faculty/grades', json={'grades': [
+            {'enrollment_id': valid, 'grade': 'A'},
+            {'enrollment_id': invalid, 'grade': 'Z'}
+        ]}, headers={
+            'Authorization': f'Bearer {faculty_token}'
+        })
+        assert response.status_code == 403
+        assert _grade(valid) is None
+    
+    def test_update_grades_bulk_rejects_oversized_batch(self, client, faculty_token):
+        """Test that batches over the limit are refused before touching the database"""
+        grades = [
+            {'enrollment_id': enrollment_id, 'grade': 'A'}
+            for enrollment_id in range(1, MAX_GRADES_PER_REQUEST + 2)
+        ]
+        response = client.put('/api/faculty/grades', json={'grades': grades}, headers={
+            'Authorization': f'Bearer {faculty_token}'
+        })
+        assert response.status_code == 400
+    
     def test_student_cannot_access_faculty(self, client, student_token):
         """Test that students cannot access faculty endpoints"""
         response = client.get('/api/faculty/my-sections', headers={
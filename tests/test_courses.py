@@ -0,0 +1,197 @@
+"""
+Course search, parameter and cursor tests
+"""
+
+import pytest
+from werkzeug.datastructures import MultiDict
+from src.courses import search_index
+from src.courses.params import ListParams, SearchParams, decode_cursor, encode_cursor
+from src.courses.search_index import CourseSearchIndex
+from src.courses.utils import course_search_cache, format_course_list
+
+
+def _course(course_id, dept_code, dept_id, course_number, title, description):
+    """Course row as returned by CourseModel.get_all_courses"""
+    return {
+        'course_id': course_id,
+        'course_number': course_number,
+        'title': title,
+        'description': description,
+        'credits': 3.0,
+        'is_active': 1,
+        'dept_id': dept_id,
+        'dept_code': dept_code,
+        'dept_name': f'{dept_code} Department',
+    }
+
+
+# Ordered by dept code, course number, as the catalog query returns it
+CATALOG = [
+    _course(1, 'BIO', 5, '101', 'Introduction to Biology', 'Cells and organisms'),
+    _course(2, 'CMSC', 1, '140', 'Introduction to Programming', 'Problem solving in Java'),
+    _course(3, 'CMSC', 1, '201', 'Computer Science I', None),
+    _course(4, 'CMSC', 1, '330', 'Advanced Programming Languages', 'Compilers and interpreters'),
+    _course(5, 'MATH', 2, '140', 'Calculus I', 'Limits and derivatives'),
+]
+
+
+def _sql_search(search_term, dept_id=None, limit=50):
+    """
+    What CourseModel.search_courses returns for the catalog
+
+    LIKE '%term%' under a case-insensitive collation, per column, with NULL
+    columns never matching.
+    """
+    needle = search_term.casefold()
+    matches = [
+        course for course in CATALOG
+        if any(
+            value is not None and needle in value.casefold()
+            for value in (course['title'], course['course_number'],
+                          course['description'], course['dept_code'])
+        )
+        and (not dept_id or course['dept_id'] == dept_id)
+    ]
+    return format_course_list(matches[:limit])
+
+
+class TestCourseSearchIndex:
+    """Test the in-memory index matches the SQL search it replaces"""
+
+    @pytest.mark.parametrize('search_term, dept_id, limit', [
+        ('intro', None, 50),
+        ('INTRO', None, 50),
+        ('programming', None, 50),
+        ('programming', 1, 50),
+        ('140', None, 50),
+        ('140', 2, 50),
+        ('cmsc', None, 50),
+        ('java', None, 50),
+        ('ma', None, 50),
+        ('i', None, 2),
+        ('ion to', None, 50),
+        ('biology cells', None, 50),
+        ('xyz', None, 50),
+    ])
+    def test_matches_sql_search(self, search_term, dept_id, limit):
+        """Test results and their order match the SQL search"""
+        index = CourseSearchIndex(CATALOG)
+        assert index.search(search_term, dept_id=dept_id, limit=limit) == (
+            _sql_search(search_term, dept_id=dept_id, limit=limit)
+        )
+
+    def test_may_contain(self):
+        """Test terms with a trigram found in no course are ruled out"""
+        index = CourseSearchIndex(CATALOG)
+        assert index.may_contain('calc')
+        assert not index.may_contain('qzx')
+
+    @pytest.fixture
+    def fresh_cache(self):
+        """Start and end without a cached index"""
+        course_search_cache.invalidate()
+        yield
+        course_search_cache.invalidate()
+
+    def test_index_built_once(self, monkeypatch, fresh_cache):
+        """Test the catalog is loaded once and reused across searches"""
+        loads = []
+
+        def get_all_courses(limit=50):
+            loads.append(limit)
+            return CATALOG
+
+        monkeypatch.setattr(search_index.CourseModel, 'get_all_courses', get_all_courses)
+        assert search_index.search_courses('intro') == _sql_search('intro')
+        assert search_index.search_courses('calculus') == _sql_search('calculus')
+        assert loads == [None]
+
+    def test_falls_back_to_sql(self, monkeypatch, fresh_cache):
+        """Test the SQL search is used when the catalog cannot be loaded"""
+        monkeypatch.setattr(search_index.CourseModel, 'get_all_courses', lambda limit=50: [])
+        monkeypatch.setattr(
+            search_index.CourseModel, 'search_courses',
+            lambda search_term, dept_id=None, limit=50: CATALOG[:1]
+        )
+        assert search_index.search_courses('bio') == format_course_list(CATALOG[:1])
+
+
+class TestSearchParams:
+    """Test search query parameter parsing"""
+
+    def test_parses_arguments(self):
+        """Test term, department and limit are read"""
+        params, error = SearchParams.from_args(MultiDict({'q': ' calc ', 'dept_id': '2', 'limit': '10'}))
+        assert error == ""
+        assert params == SearchParams(q='calc', dept_id=2, limit=10)
+
+    @pytest.mark.parametrize('args', [{}, {'q': '   '}, {'q': 'a'}])
+    def test_rejects_missing_or_short_term(self, args):
+        """Test a term under the minimum length is an error"""
+        params, error = SearchParams.from_args(MultiDict(args))
+        assert params is None
+        assert error
+
+    @pytest.mark.parametrize('limit, expected', [('0', 1), ('500', 100), ('abc', 50)])
+    def test_clamps_limit(self, limit, expected):
+        """Test the limit is clamped and invalid values use the default"""
+        params, _ = SearchParams.from_args(MultiDict({'q': 'calc', 'limit': limit}))
+        assert params.limit == expected
+
+    def test_ignores_invalid_department(self):
+        """Test a non-numeric department filter is dropped"""
+        params, _ = SearchParams.from_args(MultiDict({'q': 'calc', 'dept_id': 'CMSC'}))
+        assert params.dept_id is None
+
+
+class TestListParams:
+    """Test list query parameter parsing"""
+
+    def test_defaults(self):
+        """Test an empty query string gives the defaults"""
+        assert ListParams.from_multidict(MultiDict()) == ListParams()
+
+    def test_parses_arguments(self):
+        """Test every parameter is read"""
+        params = ListParams.from_multidict(MultiDict({
+            'limit': '20', 'offset': '40', 'cursor': 'abc',
+            'include_sections': 'True', 'term_id': '3'
+        }))
+        assert params == ListParams(
+            limit=20, offset=40, cursor='abc', include_sections=True, term_id=3
+        )
+
+    @pytest.mark.parametrize('limit, expected', [('0', 1), ('-5', 1), ('1000', 100), ('x', 50)])
+    def test_clamps_limit(self, limit, expected):
+        """Test the limit is clamped and invalid values use the default"""
+        assert ListParams.from_multidict(MultiDict({'limit': limit})).limit == expected
+
+    def test_invalid_integers_use_defaults(self):
+        """Test unparseable offset and term fall back to their defaults"""
+        params = ListParams.from_multidict(MultiDict({'offset': 'x', 'term_id': 'y'}))
+        assert params.offset == 0
+        assert params.term_id is None
+
+
+class TestCursor:
+    """Test pagination cursor encoding"""
+
+    @pytest.mark.parametrize('values', [(42,), ('CMSC', '140'), ('CMSC', 'a|b')])
+    def test_round_trip(self, values):
+        """Test decoding returns the encoded values as strings"""
+        token = encode_cursor(*values)
+        assert decode_cursor(token, len(values)) == [str(value) for value in values]
+
+    def test_token_is_url_safe(self):
+        """Test tokens need no escaping in a query string"""
+        token = encode_cursor('CMSC', '~~~???')
+        assert set(token) <= set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=')
+
+    @pytest.mark.parametrize('token', ['not base64!', 'abc', '_w=='])
+    def test_rejects_malformed_tokens(self, token):
+        """Test invalid base64 or non-UTF-8 content decodes to None"""
+        assert decode_cursor(token, 1) is None
+
+    def test_rejects_wrong_size(self):
+        """Test a token with too few values decodes to None"""
+        assert decode_cursor(encode_cursor(42), 2) is None
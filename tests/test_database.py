@@ -0,0 +1,74 @@
+"""
+Database helper tests
+"""
+
+import os
+import pytest
+from mysql.connector.cursor import RE_SQL_INSERT_STMT
+from src.utils.database import (
+    MIGRATIONS_DIR, SCHEMA_FILE, build_insert_sql, read_sql_script, schema_scripts
+)
+
+
+class TestBuildInsertSql:
+    """Test generated INSERT statements"""
+    
+    @pytest.mark.parametrize('row_count', [1, 3])
+    def test_uses_lowercase_values(self, row_count):
+        """Test the VALUES keyword is lowercase"""
+        query = build_insert_sql('course', ['course_number', 'title'], row_count)
+        assert ' values (' in query
+        assert 'VALUES' not in query
+    
+    def test_matches_batched_executemany(self):
+        """Test executemany can rewrite the statement as a multi-row INSERT"""
+        query = build_insert_sql('course', ['course_number', 'title'])
+        assert RE_SQL_INSERT_STMT.match(query)
+    
+    def test_one_placeholder_group_per_row(self):
+        """Test each row gets its own placeholder tuple"""
+        query = build_insert_sql('course', ['course_number', 'title'], 2)
+        assert query == (
+            "INSERT INTO course (course_number, title) values (%s, %s), (%s, %s)"
+        )
+    
+    @pytest.mark.parametrize('table, columns', [
+        ('course; DROP TABLE course', ['title']),
+        ('course', ['title) values (1); --']),
+        ('course', ['']),
+    ])
+    def test_rejects_invalid_identifiers(self, table, columns):
+        """Test table and column names must be plain identifiers"""
+        with pytest.raises(ValueError):
+            build_insert_sql(table, columns)
+
+
+class TestSchemaScripts:
+    """Test the scripts init_database and the setup script run"""
+    
+    def test_migrations_follow_schema_in_order(self):
+        """Test schema.sql runs first, then every migration by filename"""
+        scripts = schema_scripts()
+        assert scripts[0] == SCHEMA_FILE
+        
+        migrations = [os.path.basename(path) for path in scripts[1:]]
+        assert migrations == sorted(os.listdir(MIGRATIONS_DIR))
+        assert '003_section_counters.sql' in migrations
+    
+    def test_scripts_have_no_client_delimiters(self):
+        """Test DELIMITER directives are stripped for the server"""
+        for path in schema_scripts():
+            script = read_sql_script(path)
+            assert 'DELIMITER' not in script
+            assert 'END//' not in script
+    
+    def test_init_creates_credit_totals(self):
+        """Test the table and triggers behind the credit limit check are created"""
+        scripts = '\n'.join(read_sql_script(path) for path in schema_scripts())
+        assert 'CREATE TABLE student_term_credits' in scripts
+        for trigger in (
+            'after_enrollment_insert_credits',
+            'after_enrollment_update_credits',
+            'after_enrollment_delete_credits',
+        ):
+            assert f'CREATE TRIGGER {trigger}' in scripts
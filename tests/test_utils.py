@@ -0,0 +1,103 @@
+"""
+Cache and response helper tests
+"""
+
+import orjson
+import pytest
+from flask import Flask
+from src.utils.cache import VersionedTTLCache
+from src.utils.responses import cached_success_response, compute_etag, preencode, success_response
+
+
+class TestVersionedTTLCache:
+    """Test the catalog and lookup cache"""
+
+    def test_loads_once(self):
+        """Test a hit returns the stored value without calling the loader"""
+        cache = VersionedTTLCache(maxsize=8, ttl=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return ['row']
+
+        assert cache.get_or_load('key', loader) == ['row']
+        assert cache.get_or_load('key', loader) == ['row']
+        assert len(calls) == 1
+
+    def test_falsy_values_not_stored(self):
+        """Test empty results are retried on the next lookup"""
+        cache = VersionedTTLCache(maxsize=8, ttl=60)
+        assert cache.get_or_load('key', list) == []
+        assert cache.get_or_load('key', lambda: ['row']) == ['row']
+
+    def test_invalidate_drops_entries(self):
+        """Test invalidate forces the next lookup to load again"""
+        cache = VersionedTTLCache(maxsize=8, ttl=60)
+        cache.get_or_load('key', lambda: 'old')
+        cache.invalidate()
+        assert cache.get_or_load('key', lambda: 'new') == 'new'
+
+    def test_load_spanning_invalidation_not_stored(self):
+        """Test a load that started before an invalidation is not cached"""
+        cache = VersionedTTLCache(maxsize=8, ttl=60)
+
+        def loader():
+            # A write lands while the query is running
+            cache.invalidate()
+            return 'stale'
+
+        assert cache.get_or_load('key', loader) == 'stale'
+        assert cache.get_or_load('key', lambda: 'fresh') == 'fresh'
+
+
+@pytest.fixture
+def flask_app():
+    """Bare application for request contexts"""
+    return Flask(__name__)
+
+
+class TestCachedSuccessResponse:
+    """Test ETag and 304 handling"""
+
+    DATA = {'departments': [{'code': 'CMSC'}]}
+
+    def test_sets_etag_and_cache_headers(self, flask_app):
+        """Test a fresh request gets the body, its ETag and Cache-Control"""
+        with flask_app.test_request_context():
+            response, status_code = cached_success_response(self.DATA, max_age=60)
+
+        assert status_code == 200
+        assert response.headers['ETag'] == f'"{compute_etag(self.DATA)}"'
+        assert 'public' in response.headers['Cache-Control']
+        assert 'max-age=60' in response.headers['Cache-Control']
+        assert orjson.loads(response.get_data())['data'] == self.DATA
+
+    @pytest.mark.parametrize('header', ['"{etag}"', 'W/"{etag}"', '"other", "{etag}"'])
+    def test_matching_etag_returns_304(self, flask_app, header):
+        """Test If-None-Match holding the ETag gets an empty 304"""
+        etag = compute_etag(self.DATA)
+        headers = {'If-None-Match': header.format(etag=etag)}
+        with flask_app.test_request_context(headers=headers):
+            response, status_code = cached_success_response(self.DATA, etag=etag)
+
+        assert status_code == 304
+        assert response.get_data() == b''
+        assert response.headers['ETag'] == f'"{etag}"'
+
+    def test_stale_etag_returns_body(self, flask_app):
+        """Test an out-of-date If-None-Match gets the full response"""
+        with flask_app.test_request_context(headers={'If-None-Match': '"outdated"'}):
+            response, status_code = cached_success_response(self.DATA)
+
+        assert status_code == 200
+        assert orjson.loads(response.get_data())['data'] == self.DATA
+
+    def test_preencoded_data(self, flask_app):
+        """Test preencode's ETag matches compute_etag and its fragment embeds as-is"""
+        fragment, etag = preencode(self.DATA)
+        assert etag == compute_etag(self.DATA)
+
+        with flask_app.test_request_context():
+            response, _ = success_response(data=fragment)
+        assert orjson.loads(response.get_data())['data'] == self.DATA